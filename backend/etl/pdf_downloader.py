@@ -2,14 +2,48 @@
 PDF Downloader for downloading PDFs from URLs.
 """
 
+import hashlib
 import os
+import queue
 from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from backend.core.logging import log_handler
 
+# Shared session so batch downloads (SEC/IR mirrors serve many filings
+# from one host) reuse pooled connections instead of paying a TCP + TLS
+# handshake per file.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Pool of reusable 1 MiB download buffers. Concurrent downloads each
+# take a buffer (allocating one only if the pool is empty) and return it
+# when done, so bulk downloads stop churning the allocator.
+_BUF_SIZE = 1 << 20
+_BUF_POOL: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+
+
+def _acquire_buffer() -> bytearray:
+    try:
+        return _BUF_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_BUF_SIZE)
+
+
+def _release_buffer(buf: bytearray) -> None:
+    _BUF_POOL.put(buf)
+
 
 def download_pdf(source: str, output_dir: Optional[Path] = None) -> Dict[str, Any]:
     """
@@ -48,7 +82,7 @@ def download_pdf(source: str, output_dir: Optional[Path] = None) -> Dict[str, An
 
     try:
         # Download PDF
-        response = requests.get(source, timeout=30, stream=True)
+        response = _SESSION.get(source, timeout=30, stream=True)
         response.raise_for_status()
 
         # Check content type
@@ -63,22 +97,44 @@ def download_pdf(source: str, output_dir: Optional[Path] = None) -> Dict[str, An
         if not filename.endswith(".pdf"):
             filename += ".pdf"
 
-        # Save to output directory
+        # Save to output directory, hashing each chunk as it is written
+        # so the file is never re-read just to fingerprint it
         file_path = output_dir / filename
         file_size = 0
+        sha256_hash = hashlib.sha256()
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                file_size += len(chunk)
+        # Prefer reading into one reused buffer: hash and write see
+        # memoryview slices of the same 1 MiB bytearray, so no per-chunk
+        # bytes objects are allocated. Only safe when the body is not
+        # content-encoded, since readinto bypasses decoding.
+        raw = getattr(response, "raw", None)
+        use_readinto = (
+            raw is not None
+            and hasattr(raw, "readinto")
+            and not response.headers.get("content-encoding")
+        )
 
-        # Calculate SHA256 hash
-        import hashlib
+        with open(file_path, "wb") as f:
+            if use_readinto:
+                buf = _acquire_buffer()
+                view = memoryview(buf)
+                try:
+                    while True:
+                        n = raw.readinto(buf)
+                        if not n:
+                            break
+                        sha256_hash.update(view[:n])
+                        f.write(view[:n])
+                        file_size += n
+                finally:
+                    view.release()
+                    _release_buffer(buf)
+            else:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    file_size += len(chunk)
 
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
         sha256 = sha256_hash.hexdigest()
 
         log_handler.info(
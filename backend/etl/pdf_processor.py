@@ -74,12 +74,18 @@ def _extract_hybrid(doc: fitz.Document, threshold: int) -> list[dict[str, Any]]:
     return pages
 
 
-def process_pdf(source: str, use_ocr: bool | None = None) -> dict[str, Any]:
-    pdf_path = Path(source)
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+def process_pdf(
+    source: str | Path | bytes | bytearray, use_ocr: bool | None = None
+) -> dict[str, Any]:
+    if isinstance(source, (bytes, bytearray)):
+        # Already in memory (e.g. an upload); parse without a file round-trip
+        pdf_bytes = bytes(source)
+    else:
+        pdf_path = Path(source)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+        pdf_bytes = pdf_path.read_bytes()
 
-    pdf_bytes = pdf_path.read_bytes()
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
 
     if use_ocr is None:
@@ -0,0 +1,86 @@
+"""
+In-process cache for LLM responses.
+
+Repeated prompts — common in test suites and iterative development where
+the same transcript is analyzed over and over — short-circuit to the
+stored response instead of paying the OpenAI round-trip and decode.
+
+Entries are keyed on SHA256 of the operation name plus the full prompt
+payload, so only byte-identical requests hit. A semantic tier (embedding
+similarity over near-duplicate prompts) can be layered on top later; the
+lookup interface already takes the raw payload for that reason.
+
+Caching is off by default and enabled via the ``openai.cache_enabled``
+config flag or the ``LLM_CACHE`` environment variable, so mocked tests
+that return different responses for the same prompt are unaffected
+unless they opt in.
+"""
+
+import copy
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+from backend.core.config import config
+from backend.core.logging import log_handler
+
+
+class LLMCache:
+    """Bounded LRU cache for LLM responses keyed on exact prompt bytes."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(operation: str, *parts: str) -> str:
+        """Build a cache key from an operation name and prompt parts."""
+        hasher = hashlib.sha256(operation.encode("utf-8"))
+        for part in parts:
+            hasher.update(b"\x00")
+            hasher.update(part.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Deep-copy so callers mutating the result don't poison the cache
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_enabled() -> bool:
+    """Whether LLM response caching is turned on."""
+    if os.getenv("LLM_CACHE"):
+        return True
+    return bool(config.get("openai", {}).get("cache_enabled", False))
+
+
+# Shared instance used by the AI agent service
+llm_cache = LLMCache(
+    max_entries=config.get("openai", {}).get("cache_max_entries", 256)
+)
+log_handler.debug(f"LLM cache initialized (enabled: {cache_enabled()})")
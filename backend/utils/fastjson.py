@@ -0,0 +1,42 @@
+"""
+Thin JSON shim that prefers the fastest available library.
+
+Prefers orjson, then ujson, then the stdlib json module. All three raise
+a ValueError subclass on malformed input, so callers can keep catching
+ValueError (or JSONDecodeError) regardless of which backend is active.
+"""
+
+try:
+    import orjson as _backend
+
+    def loads(data):
+        """Parse JSON from str, bytes, bytearray or memoryview."""
+        return _backend.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return _backend.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj directly to JSON bytes (skips str round-trip)."""
+        return _backend.dumps(obj)
+
+except ImportError:
+    try:
+        import ujson as _backend
+    except ImportError:
+        import json as _backend
+
+    def loads(data):
+        """Parse JSON from str, bytes, bytearray or memoryview."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _backend.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return _backend.dumps(obj)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj directly to JSON bytes (skips str round-trip)."""
+        return _backend.dumps(obj).encode("utf-8")
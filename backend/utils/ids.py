@@ -0,0 +1,18 @@
+"""
+Fast, non-cryptographic content identifiers.
+
+Chunk ids only need to be stable and collision-resistant enough for
+dict keys and storage lookups; they carry no security guarantee, so a
+short BLAKE2b digest is used instead of a full SHA-256 pass. Document
+hashes kept for audit (e.g. download_pdf's sha256 field) stay SHA-256.
+"""
+
+import hashlib
+from typing import Union
+
+
+def chunk_id(content: Union[str, bytes]) -> str:
+    """Return a stable 16-hex-char id for a chunk body."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
@@ -1,4 +1,5 @@
 import tower
+import sys
 import polars as pl
 
 
@@ -23,21 +24,37 @@ def main():
     print(f"Total rows: {len(df)}")
     print(f"{'='*60}\n")
     
-    # Step 3: Print each row (truncating HTML content for readability)
-    for i, row in enumerate(df.iter_rows(named=True)):
-        print(f"--- Record {i + 1} ---")
-        print(f"URL: {row['url']}")
-        print(f"Content Hash: {row['content_hash']}")
-        print(f"Fetched At: {row['fetched_at']}")
-        print(f"Content Length: {row['content_length']} characters")
-        
-        # Truncate HTML content for display
-        html_content = row['html_content'] or ""
-        html_preview = html_content[:200]
-        if len(html_content) > 200:
+    # Step 3: Print each row (truncating HTML content for readability).
+    # Truncate inside Polars so the full html_content column is never
+    # copied into Python just to slice the first 200 characters.
+    preview_df = (
+        df.lazy()
+        .with_columns(
+            pl.col('html_content').str.slice(0, 200).alias('html_preview'),
+            pl.col('html_content').str.len_chars().alias('html_len'),
+        )
+        .drop('html_content')
+        .collect()
+    )
+
+    # Accumulate the report and emit it with one write; per-row print
+    # calls flush line-by-line and dominate runtime on large tables.
+    out = []
+    for i, row in enumerate(preview_df.iter_rows(named=True)):
+        html_preview = row['html_preview'] or ""
+        if (row['html_len'] or 0) > 200:
             html_preview += "..."
-        print(f"HTML Preview: {html_preview}")
-        print()
+
+        out.append(
+            f"--- Record {i + 1} ---\n"
+            f"URL: {row['url']}\n"
+            f"Content Hash: {row['content_hash']}\n"
+            f"Fetched At: {row['fetched_at']}\n"
+            f"Content Length: {row['content_length']} characters\n"
+            f"HTML Preview: {html_preview}\n\n"
+        )
+
+    sys.stdout.write(''.join(out))
     
     # Step 4: Print schema info
     print(f"{'='*60}")
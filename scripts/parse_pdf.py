@@ -1,8 +1,11 @@
 import argparse
-import json
+import hashlib
+import os
 import sys
 from pathlib import Path
 
+import orjson
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
@@ -23,9 +26,28 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    result = process_pdf(args.pdf)
     output_path = Path(args.out)
-    output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    # Skip the parse when the output is newer than the PDF; FORCE=1
+    # re-parses regardless.
+    if (
+        output_path.exists()
+        and output_path.stat().st_mtime >= os.path.getmtime(args.pdf)
+        and not os.getenv("FORCE")
+    ):
+        print(f"{output_path} is up to date (set FORCE=1 to re-parse)")
+        return
+
+    # Read the PDF once and parse in memory; the same buffer feeds the
+    # fingerprint below.
+    pdf_bytes = Path(args.pdf).read_bytes()
+    result = process_pdf(pdf_bytes)
+    # Record the source fingerprint so caches shared across machines can
+    # be validated without trusting mtimes.
+    result["pdf_sha256"] = hashlib.sha256(pdf_bytes).hexdigest()
+    # orjson emits UTF-8 bytes directly, skipping the intermediate str
+    # that json.dumps + write_text would allocate for large parses.
+    output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     print(f"Wrote {output_path}")
 
 
@@ -12,14 +12,18 @@ from fastapi.testclient import TestClient
 from fastapi import status
 from backend.main import app
 
+# Single client shared by all tests; building a TestClient per test
+# re-runs the app startup machinery for no benefit.
+_client = TestClient(app)
+
 
 class TestAIAgentAPI:
     """Test cases for AI Agent API endpoints."""
-    
+
     @pytest.fixture
     def client(self):
-        """Create test client."""
-        return TestClient(app)
+        """Return the shared test client."""
+        return _client
     
     @pytest.fixture
     def sample_transcript(self):
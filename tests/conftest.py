@@ -1 +1,6 @@
+"""Shared pytest setup: put the project root on sys.path once."""
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -4,9 +4,18 @@ Tests for Text Normalizer.
 
 import pytest
 
+from backend.etl import normalizer
 from backend.etl.normalizer import normalize_text, normalize_date, normalize_number
 
 
+def _regex_normalize(text):
+    """Apply the regex path directly, bypassing the size dispatch."""
+    text = normalizer._MULTI_NEWLINE.sub("\n\n", text)
+    text = normalizer._LINE_WHITESPACE.sub(" ", text)
+    text = normalizer._LINE_EDGES.sub("", text)
+    return text.strip()
+
+
 class TestNormalizer:
     """Test text normalizer functionality."""
 
@@ -48,16 +57,37 @@ class TestNormalizer:
         assert "  " not in result
         assert "\n\n\n" not in result
 
-    def test_normalize_number_placeholder(self):
-        """Test number normalizer (placeholder)."""
+    def test_normalize_text_large_matches_regex_path(self):
+        """Test the vectorized path on large input matches the regex path."""
+        paragraph = "  Revenue   grew\t\tsharply — naïve\r\n\n\n\nestimates   aside.  \n"
+        text = paragraph * 200
+        assert len(text) > normalizer._VECTOR_THRESHOLD
+
+        result = normalize_text(text)
+        assert result == _regex_normalize(text)
+        assert "  " not in result
+        assert "\n\n\n" not in result
+
+    def test_normalize_number_strips_thousands_separators(self):
+        """Test number normalizer removes thousands separators."""
         text = "Revenue: $100,000"
         result = normalize_number(text)
-        # Currently just returns as-is
+        assert result == "Revenue: $100000"
+
+    def test_normalize_number_no_digits_passthrough(self):
+        """Test number normalizer leaves digit-free text unchanged."""
+        text = "No numbers here"
+        result = normalize_number(text)
         assert result == text
 
-    def test_normalize_date_placeholder(self):
-        """Test date normalizer (placeholder)."""
+    def test_normalize_date_to_iso(self):
+        """Test date normalizer rewrites US dates to ISO format."""
         text = "Date: 01/25/2026"
         result = normalize_date(text)
-        # Currently just returns as-is
+        assert result == "Date: 2026-01-25"
+
+    def test_normalize_date_no_digits_passthrough(self):
+        """Test date normalizer leaves digit-free text unchanged."""
+        text = "No dates here"
+        result = normalize_date(text)
         assert result == text
@@ -13,13 +13,14 @@ from backend.etl.pdf_downloader import download_pdf
 class TestPDFDownloader:
     """Test PDF downloader functionality."""
 
-    @patch("backend.etl.pdf_downloader.requests.get")
+    @patch("backend.etl.pdf_downloader._SESSION.get")
     def test_download_pdf_success(self, mock_get, tmp_path):
         """Test successful PDF download."""
         # Mock HTTP response
         mock_response = Mock()
         mock_response.headers = {"content-type": "application/pdf"}
         mock_response.iter_content.return_value = [b"PDF content"]
+        mock_response.raw = None  # exercise the iter_content fallback
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -34,12 +35,13 @@ class TestPDFDownloader:
         assert Path(result["file_path"]).exists()
         assert len(result["sha256"]) == 64
 
-    @patch("backend.etl.pdf_downloader.requests.get")
+    @patch("backend.etl.pdf_downloader._SESSION.get")
     def test_download_pdf_wrong_content_type(self, mock_get, tmp_path):
         """Test download with wrong content type (should still work with warning)."""
         mock_response = Mock()
         mock_response.headers = {"content-type": "text/html"}
         mock_response.iter_content.return_value = [b"PDF content"]
+        mock_response.raw = None  # exercise the iter_content fallback
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -50,12 +52,32 @@ class TestPDFDownloader:
         assert result["file_path"]
         assert Path(result["file_path"]).exists()
 
+    @patch("backend.etl.pdf_downloader._SESSION.get")
+    def test_download_pdf_readinto_path(self, mock_get, tmp_path):
+        """Test the zero-copy readinto path used for unencoded bodies."""
+        import hashlib
+        import io
+
+        mock_response = Mock()
+        mock_response.headers = {"content-type": "application/pdf"}
+        mock_response.raw = io.BytesIO(b"PDF content")
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        url = "https://example.com/test.pdf"
+        result = download_pdf(url, output_dir=tmp_path)
+
+        assert Path(result["file_path"]).read_bytes() == b"PDF content"
+        assert result["file_size"] == len(b"PDF content")
+        assert result["sha256"] == hashlib.sha256(b"PDF content").hexdigest()
+        mock_response.iter_content.assert_not_called()
+
     def test_download_pdf_invalid_url(self):
         """Test download with invalid URL."""
         with pytest.raises(ValueError, match="Invalid URL"):
             download_pdf("not-a-url")
 
-    @patch("backend.etl.pdf_downloader.requests.get")
+    @patch("backend.etl.pdf_downloader._SESSION.get")
     def test_download_pdf_network_error(self, mock_get):
         """Test download with network error."""
         import requests
@@ -64,7 +86,7 @@ class TestPDFDownloader:
         with pytest.raises(ValueError, match="Failed to download"):
             download_pdf("https://example.com/test.pdf")
 
-    @patch("backend.etl.pdf_downloader.requests.get")
+    @patch("backend.etl.pdf_downloader._SESSION.get")
     def test_download_pdf_http_error(self, mock_get):
         """Test download with HTTP error."""
         import requests
@@ -1,11 +1,27 @@
-import json
+import mmap
 from pathlib import Path
 
 from backend.services.rag_service import retrieve_chunks
+from backend.utils.fastjson import loads
+
+# Below this size the mmap setup costs more than it saves
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, memory-mapping it when large enough to matter."""
+    if path.stat().st_size < _MMAP_THRESHOLD:
+        return loads(path.read_bytes())
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return loads(memoryview(mm))
+        finally:
+            mm.close()
 
 
 def main() -> None:
-    data = json.loads(Path("parsed_output.json").read_text(encoding="utf-8"))
+    data = _load_json(Path("parsed_output.json"))
     query = "revenue growth"
     chunks = [{"content": page.get("text", "")} for page in data.get("pages", [])]
     results = retrieve_chunks(query, chunks, top_k=5)
@@ -4,50 +4,125 @@ Verifies claims against document chunks
 """
 
 import json
-from typing import List, Dict, Any
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 
-def hybrid_search(chunks: List[Dict[str, Any]], query: str, top_k: int = 3) -> List[Dict]:
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _prepare_chunks(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Cache the lowercased content on each chunk.
+
+    Lowercasing is O(len(content)) per call; doing it once when the
+    chunks are loaded lets every claim verified against the same corpus
+    reuse the result.
+    """
+    for chunk in chunks:
+        if "_content_lower" not in chunk:
+            chunk["_content_lower"] = chunk["content"].lower()
+    return chunks
+
+
+def _build_chunk_index(chunks: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Build an inverted index of token -> chunk indices.
+
+    Built once per chunk set and reused across claims, so scoring a claim
+    is a few array lookups plus one bincount instead of a Python substring
+    scan over every chunk.
+    """
+    postings: Dict[str, List[int]] = {}
+    for i, chunk in enumerate(chunks):
+        content_lower = chunk.get("_content_lower") or chunk['content'].lower()
+        for token in set(_TOKEN.findall(content_lower)):
+            postings.setdefault(token, []).append(i)
+    return {token: np.asarray(ix, dtype=np.intp) for token, ix in postings.items()}
+
+
+def hybrid_search(
+    chunks: List[Dict[str, Any]],
+    query: str,
+    top_k: int = 3,
+    index: Optional[Dict[str, np.ndarray]] = None,
+) -> List[Dict]:
     """
     Simple hybrid search combining keyword and semantic matching.
     In production, this would use embeddings.
     """
+    if not chunks:
+        return []
+
+    if index is None:
+        index = _build_chunk_index(chunks)
+
+    query_words = set(_TOKEN.findall(query.lower()))
+    if not query_words:
+        return []
+
+    # One C-level bincount over the concatenated postings gives the
+    # per-chunk match counts for the whole query.
+    hit_lists = [index[word] for word in query_words if word in index]
+    if not hit_lists:
+        return []
+
+    counts = np.bincount(np.concatenate(hit_lists), minlength=len(chunks))
+
+    # Normalize only the chunks that matched at all; on large corpora
+    # most counts are zero and a full-length float divide is wasted work.
+    matched = np.flatnonzero(counts)
+    matched_scores = counts[matched] / len(query_words)
+
+    if len(matched) > top_k:
+        keep = np.argpartition(matched_scores, -top_k)[-top_k:]
+    else:
+        keep = np.arange(len(matched))
+    order = keep[np.argsort(matched_scores[keep])[::-1]]
+
     results = []
-    
-    # Keyword matching
-    query_lower = query.lower()
-    query_words = set(query_lower.split())
-    
-    for chunk in chunks:
-        content_lower = chunk['content'].lower()
-        
-        # Calculate keyword match score
-        matches = sum(1 for word in query_words if word in content_lower)
-        score = matches / len(query_words) if query_words else 0
-        
-        if score > 0:
-            results.append({
-                "chunk_id": chunk['chunk_id'],
-                "page_number": chunk['page_number'],
-                "score": score,
-                "preview": content_lower[:100] + "...",
-            })
-    
-    # Sort by score
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results[:top_k]
-
-
-def verify_claim(claim: str, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    for j in order:
+        chunk = chunks[matched[j]]
+        results.append({
+            "chunk_id": chunk['chunk_id'],
+            "page_number": chunk['page_number'],
+            "score": float(matched_scores[j]),
+            "preview": (
+                chunk["_content_lower"][:100]
+                if "_content_lower" in chunk
+                # Lower only the preview slice, not the whole content
+                else chunk['content'][:100].lower()
+            ) + "...",
+        })
+    return results
+
+
+# Corpora registered for memoized verification, keyed by fingerprint.
+_CORPUS_BY_SIG: Dict[int, Tuple[List[Dict[str, Any]], Optional[Dict[str, np.ndarray]]]] = {}
+
+
+def _chunks_signature(chunks: List[Dict[str, Any]]) -> int:
     """
-    Verify a claim against document chunks.
+    Fingerprint of a chunk set based on chunk ids and contents.
+
+    Including content means a corpus whose text changed under the same
+    ids gets a fresh cache entry instead of stale verdicts. Python
+    caches string hashes on the objects, so repeat calls stay cheap.
     """
-    search_results = hybrid_search(chunks, claim)
-    
+    return hash(tuple((chunk["chunk_id"], chunk["content"]) for chunk in chunks))
+
+
+@lru_cache(maxsize=1024)
+def _verify_cached(claim: str, sig: int) -> Dict[str, Any]:
+    chunks, index = _CORPUS_BY_SIG[sig]
+    search_results = hybrid_search(chunks, claim, index=index)
+
     verdict = "NOT_FOUND"
     if search_results and search_results[0]['score'] > 0.3:
         verdict = "FOUND_IN_DOCUMENT"
-    
+
     return {
         "claim": claim,
         "verdict": verdict,
@@ -56,6 +131,30 @@ def verify_claim(claim: str, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def verify_claim(
+    claim: str,
+    chunks: List[Dict[str, Any]],
+    index: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, Any]:
+    """
+    Verify a claim against document chunks.
+
+    Repeated claims against the same chunk set are memoized; a copy is
+    returned so callers can mutate results without poisoning the cache.
+    """
+    sig = _chunks_signature(chunks)
+    if sig not in _CORPUS_BY_SIG:
+        _CORPUS_BY_SIG[sig] = (chunks, index)
+    elif index is not None and _CORPUS_BY_SIG[sig][1] is None:
+        _CORPUS_BY_SIG[sig] = (chunks, index)
+    result = dict(_verify_cached(claim, sig))
+    # top_result is the dict stored in the cache; copy it too so
+    # mutating it cannot corrupt later hits
+    if result["top_result"] is not None:
+        result["top_result"] = dict(result["top_result"])
+    return result
+
+
 def main():
     """Run RAG verification test."""
     # This would be loaded from Tower in production
@@ -66,18 +165,22 @@ def main():
             "content": "Duolingo reported strong user growth in Q3 2025...",
         }
     ]
-    
+
     test_claims = [
         "Duolingo reported strong user growth in Q3 2025",
         "Revenue increased significantly",
         "New markets were entered",
     ]
-    
+
+    # Lowercase and index the chunk set once; every claim reuses both
+    _prepare_chunks(test_chunks)
+    index = _build_chunk_index(test_chunks)
+
     print("RAG Verification Results:")
     print("-" * 60)
-    
+
     for claim in test_claims:
-        result = verify_claim(claim, test_chunks)
+        result = verify_claim(claim, test_chunks, index=index)
         print(f"Claim: {result['claim']}")
         print(f"Verdict: {result['verdict']}")
         print(f"Matches: {result['matches']}")
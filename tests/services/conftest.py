@@ -0,0 +1,26 @@
+"""Shared lightweight fakes for service tests.
+
+Plain classes instead of Mock where only data needs to flow: no
+per-attribute Mock creation, no call-tracking overhead. Mock stays in
+use where tests actually assert on calls.
+"""
+
+import pytest
+
+
+class FakeTowerStore:
+    """Minimal stand-in for TowerChunkStore: returns canned rows."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def read_all(self):
+        return self._rows
+
+
+@pytest.fixture
+def fake_tower_store():
+    """Factory producing a TowerChunkStore replacement with given rows."""
+    def _make(rows):
+        return lambda **kwargs: FakeTowerStore(rows)
+    return _make
@@ -1,22 +1,70 @@
 import pytest
 import asyncio
+import json
 import os
-import sys
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock
 
-# Add project root to path
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, project_root)
-
 from backend.services.ai_agent_service import AIAgentService, ai_agent_service
 
+# Mock LLM payloads serialized once at import instead of rebuilt per test
+_MOCK_CLAIMS_JSON = json.dumps([
+    {
+        "claim": "Revenue grew by 25% this quarter",
+        "category": "revenue",
+        "confidence": "high",
+        "numerical_values": ["25%"],
+        "context": "quarterly performance"
+    }
+])
+
+_MOCK_COMPARE_JSON = json.dumps({
+    "verified_claims": [
+        {
+            "claim": "Revenue grew by 25% this quarter",
+            "status": "CONTRADICTED",
+            "evidence": "Revenue increased by 23%",
+            "confidence": "high",
+            "notes": "Slight discrepancy in growth rate"
+        }
+    ],
+    "summary": {
+        "total_claims": 2,
+        "verified": 0,
+        "contradicted": 1,
+        "not_found": 1,
+        "overall_accuracy": "50%"
+    },
+    "key_discrepancies": [
+        {
+            "claim": "Revenue grew by 25%",
+            "transcript_version": "25% growth",
+            "official_version": "23% growth",
+            "severity": "low"
+        }
+    ]
+})
+
+
+def _mock_openai_client(content: str):
+    """Build a minimal fake OpenAI client returning the given content.
+
+    Only the create call is async; the response tree is plain namespaces,
+    so attribute access doesn't spawn AsyncMock children or stray
+    coroutines.
+    """
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock(return_value=response)))
+    )
+
 
 class TestAIAgentService:
     """Test cases for AI Agent Service."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create AI Agent Service instance for testing."""
+        """Create one AI Agent Service instance shared across the module's tests."""
         return AIAgentService()
     
     @pytest.fixture
@@ -80,44 +128,48 @@ class TestAIAgentService:
         assert result == []
     
     @pytest.mark.asyncio
-    @patch('backend.services.ai_agent_service.client')
-    async def test_extract_claims_success(self, mock_client, service, sample_transcript):
+    async def test_extract_claims_success(self, service, sample_transcript):
         """Test successful claim extraction."""
-        # Mock OpenAI response
-        mock_response = AsyncMock()
-        mock_response.choices[0].message.content = '''[
-            {
-                "claim": "Revenue grew by 25% this quarter",
-                "category": "revenue",
-                "confidence": "high",
-                "numerical_values": ["25%"],
-                "context": "quarterly performance"
-            }
-        ]'''
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        result = await service.extract_claims_from_transcript(sample_transcript)
-        
+        mock_client = _mock_openai_client(_MOCK_CLAIMS_JSON)
+
+        with patch.object(service, "_client", mock_client):
+            result = await service.extract_claims_from_transcript(sample_transcript)
+
         assert len(result) == 1
         assert result[0]["claim"] == "Revenue grew by 25% this quarter"
         assert result[0]["category"] == "revenue"
         assert result[0]["confidence"] == "high"
-    
+
     @pytest.mark.asyncio
-    @patch('backend.services.ai_agent_service.client')
-    async def test_extract_claims_invalid_json(self, mock_client, service, sample_transcript):
+    async def test_extract_claims_invalid_json(self, service, sample_transcript):
         """Test claim extraction with invalid JSON response."""
-        # Mock OpenAI response with invalid JSON
-        mock_response = AsyncMock()
-        mock_response.choices[0].message.content = "Invalid JSON response"
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        result = await service.extract_claims_from_transcript(sample_transcript)
-        
+        mock_client = _mock_openai_client("Invalid JSON response")
+
+        with patch.object(service, "_client", mock_client):
+            result = await service.extract_claims_from_transcript(sample_transcript)
+
         assert len(result) == 1
         assert result[0]["claim"] == "Invalid JSON response"
         assert result[0]["category"] == "other"
     
+    @pytest.mark.asyncio
+    async def test_extract_claims_batch_empty(self, service):
+        """Test batched claim extraction with no transcripts."""
+        result = await service.extract_claims_batch([])
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_extract_claims_batch_preserves_order(self, service):
+        """Test batched claim extraction returns per-transcript results in order."""
+        async def fake_extract(transcript):
+            return [{"claim": transcript, "category": "other"}]
+
+        with patch.object(service, "extract_claims_from_transcript", side_effect=fake_extract):
+            result = await service.extract_claims_batch(["first", "second", "third"])
+
+        assert len(result) == 3
+        assert [claims[0]["claim"] for claims in result] == ["first", "second", "third"]
+
     @pytest.mark.asyncio
     async def test_compare_empty_claims(self, service, sample_shareholder_letter):
         """Test comparison with empty claims."""
@@ -139,41 +191,13 @@ class TestAIAgentService:
         assert "No shareholder letter content" in result["summary"]
     
     @pytest.mark.asyncio
-    @patch('backend.services.ai_agent_service.client')
-    async def test_compare_success(self, mock_client, service, sample_claims, sample_shareholder_letter):
+    async def test_compare_success(self, service, sample_claims, sample_shareholder_letter):
         """Test successful comparison."""
-        # Mock OpenAI response
-        mock_response = AsyncMock()
-        mock_response.choices[0].message.content = '''{
-            "verified_claims": [
-                {
-                    "claim": "Revenue grew by 25% this quarter",
-                    "status": "CONTRADICTED",
-                    "evidence": "Revenue increased by 23%",
-                    "confidence": "high",
-                    "notes": "Slight discrepancy in growth rate"
-                }
-            ],
-            "summary": {
-                "total_claims": 2,
-                "verified": 0,
-                "contradicted": 1,
-                "not_found": 1,
-                "overall_accuracy": "50%"
-            },
-            "key_discrepancies": [
-                {
-                    "claim": "Revenue grew by 25%",
-                    "transcript_version": "25% growth",
-                    "official_version": "23% growth",
-                    "severity": "low"
-                }
-            ]
-        }'''
-        mock_client.chat.completions.create.return_value = mock_response
-        
-        result = await service.compare_with_shareholder_letter(sample_claims, sample_shareholder_letter)
-        
+        mock_client = _mock_openai_client(_MOCK_COMPARE_JSON)
+
+        with patch.object(service, "_client", mock_client):
+            result = await service.compare_with_shareholder_letter(sample_claims, sample_shareholder_letter)
+
         assert "verified_claims" in result
         assert "summary" in result
         assert "key_discrepancies" in result
@@ -0,0 +1,56 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import pytest
+
+from backend.services._llm_cache import LLMCache
+
+
+class TestLLMCache:
+    """Test LLM cache behaviour."""
+
+    def test_miss_then_hit(self):
+        """A stored response is returned on the next lookup."""
+        cache = LLMCache(max_entries=4)
+        key = LLMCache.make_key("extract_claims", "some transcript")
+
+        assert cache.get(key) is None
+        cache.put(key, [{"claim": "Revenue grew"}])
+        assert cache.get(key) == [{"claim": "Revenue grew"}]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_distinct_prompts_get_distinct_keys(self):
+        """Different payloads never collide on the same key."""
+        key1 = LLMCache.make_key("extract_claims", "transcript A")
+        key2 = LLMCache.make_key("extract_claims", "transcript B")
+        key3 = LLMCache.make_key("compare_claims", "transcript A")
+
+        assert len({key1, key2, key3}) == 3
+
+    def test_eviction_drops_least_recently_used(self):
+        """Oldest entry is evicted once the cache is full."""
+        cache = LLMCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # refresh "a"
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_cached_value_is_isolated_from_mutation(self):
+        """Mutating a returned result must not poison the cache."""
+        cache = LLMCache(max_entries=4)
+        cache.put("key", {"claims": []})
+
+        first = cache.get("key")
+        first["claims"].append("mutated")
+
+        assert cache.get("key") == {"claims": []}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
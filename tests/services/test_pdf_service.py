@@ -3,6 +3,7 @@ Tests for PDF Service.
 """
 
 import hashlib
+import io
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -20,24 +21,50 @@ class TestPDFService:
         assert service.temp_dir.exists()
         assert service.temp_dir.name == "temp_pdfs"
 
-    def test_calculate_sha256(self, tmp_path):
-        """Test SHA256 hash calculation."""
+    def test_calculate_sha256(self):
+        """Test SHA256 hash calculation from an in-memory stream."""
         service = PDFService()
-        
-        # Create a test file
-        test_file = tmp_path / "test.pdf"
-        test_file.write_bytes(b"test content")
-        
-        sha256 = service._calculate_sha256(test_file)
-        
+
+        sha256 = service._calculate_sha256(io.BytesIO(b"test content"))
+
         # Verify it's a valid SHA256 hash (64 hex characters)
         assert len(sha256) == 64
         assert all(c in "0123456789abcdef" for c in sha256)
-        
+
         # Verify it's correct
         expected = hashlib.sha256(b"test content").hexdigest()
         assert sha256 == expected
 
+    def test_calculate_sha256_path(self, tmp_path):
+        """Test SHA256 hash calculation from a file path."""
+        service = PDFService()
+
+        test_file = tmp_path / "test.pdf"
+        test_file.write_bytes(b"test content")
+
+        assert service._calculate_sha256(test_file) == hashlib.sha256(b"test content").hexdigest()
+
+    def test_hash_many(self, tmp_path):
+        """Test concurrent hashing of several files."""
+        service = PDFService()
+
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"doc_{i}.pdf"
+            path.write_bytes(f"pdf body {i}".encode())
+            paths.append(path)
+
+        digests = service.hash_many(paths)
+
+        assert len(digests) == 8
+        for i, path in enumerate(paths):
+            assert digests[path] == hashlib.sha256(f"pdf body {i}".encode()).hexdigest()
+
+    def test_hash_many_empty(self):
+        """Test concurrent hashing with no files."""
+        service = PDFService()
+        assert service.hash_many([]) == {}
+
     @patch("backend.services.pdf_service.requests.get")
     def test_download_pdf_from_url_success(self, mock_get, tmp_path):
         """Test successful PDF download from URL."""
@@ -52,10 +79,11 @@ class TestPDFService:
         mock_get.return_value = mock_response
         
         url = "https://example.com/test.pdf"
-        result = service._download_pdf_from_url(url)
-        
+        result, sha256 = service._download_pdf_from_url(url)
+
         assert result.exists()
         assert result.name == "test.pdf"
+        assert sha256 == hashlib.sha256(b"PDF content").hexdigest()
         mock_get.assert_called_once()
 
     @patch("backend.services.pdf_service.requests.get")
@@ -124,6 +152,28 @@ class TestPDFService:
         assert "full_text" in result
         assert result["source_type"] == "local"
 
+    @patch("backend.services.pdf_service.PDF_PROCESSOR_AVAILABLE", True)
+    @patch("backend.services.pdf_service.process_pdf")
+    def test_process_pdf_cache_hit(self, mock_process_pdf, tmp_path):
+        """Test that re-processing identical content skips the engine."""
+        service = PDFService()
+        service.temp_dir = tmp_path
+
+        test_file = tmp_path / "test.pdf"
+        test_file.write_bytes(b"dummy pdf content for caching")
+
+        mock_process_pdf.return_value = {
+            "engine": "hybrid",
+            "pages": [{"page": 1, "text": "Test", "source": "text"}],
+        }
+
+        first = service.process_pdf(str(test_file), generate_chunks=False)
+        second = service.process_pdf(str(test_file), generate_chunks=False)
+
+        mock_process_pdf.assert_called_once()
+        assert second["sha256"] == first["sha256"]
+        assert second["full_text"] == first["full_text"]
+
     @patch("backend.services.pdf_service.PDF_PROCESSOR_AVAILABLE", True)
     @patch("backend.services.pdf_service.process_pdf")
     @patch("backend.services.pdf_service.PDFService._download_pdf_from_url")
@@ -134,7 +184,7 @@ class TestPDFService:
         
         test_file = tmp_path / "downloaded.pdf"
         test_file.write_bytes(b"dummy")
-        mock_download.return_value = test_file
+        mock_download.return_value = (test_file, hashlib.sha256(b"dummy").hexdigest())
         
         mock_process_pdf.return_value = {
             "engine": "hybrid",
@@ -211,6 +261,7 @@ class TestPDFServiceIntegration:
         not __import__("backend.services.pdf_service", fromlist=["PDF_PROCESSOR_AVAILABLE"]).PDF_PROCESSOR_AVAILABLE,
         reason="PDF processor not available (fitz/PyMuPDF not installed)",
     )
+    @pytest.mark.serial
     def test_process_pdf_real_file(self):
         """Test processing a real PDF file."""
         service = PDFService()
@@ -219,16 +219,15 @@ class TestRAGServiceTower:
     @patch("backend.services.rag_service.TOWER_RAG_AVAILABLE", True)
     @patch("backend.services.rag_service.TowerChunkStore")
     @patch("backend.services.rag_service._get_query_embedding")
-    async def test_retrieve_chunks_from_tower_keyword(self, mock_embedding, mock_store_class):
+    async def test_retrieve_chunks_from_tower_keyword(
+        self, mock_embedding, mock_store_class, fake_tower_store
+    ):
         """Test Tower retrieval with keyword search."""
-        # Mock chunk store
-        mock_store = Mock()
-        mock_store.read_all.return_value = [
+        mock_store_class.side_effect = fake_tower_store([
             {"document_id": "doc1", "content": "Revenue grew", "chunk_id": "1"},
             {"document_id": "doc2", "content": "Users increased", "chunk_id": "2"},
-        ]
-        mock_store_class.return_value = mock_store
-        
+        ])
+
         results = await retrieve_chunks_from_tower(
             document_id="doc1",
             query="revenue",
@@ -244,23 +243,22 @@ class TestRAGServiceTower:
     @patch("backend.services.rag_service.TOWER_RAG_AVAILABLE", True)
     @patch("backend.services.rag_service.TowerChunkStore")
     @patch("backend.services.rag_service._get_query_embedding")
-    async def test_retrieve_chunks_from_tower_semantic(self, mock_embedding, mock_store_class):
+    async def test_retrieve_chunks_from_tower_semantic(
+        self, mock_embedding, mock_store_class, fake_tower_store
+    ):
         """Test Tower retrieval with semantic search."""
         # Mock embedding
         mock_embedding.return_value = [0.1, 0.2, 0.3]
-        
-        # Mock chunk store
-        mock_store = Mock()
-        mock_store.read_all.return_value = [
+
+        mock_store_class.side_effect = fake_tower_store([
             {
                 "document_id": "doc1",
                 "content": "Revenue",
                 "chunk_id": "1",
                 "embedding": [0.1, 0.2, 0.3]
             },
-        ]
-        mock_store_class.return_value = mock_store
-        
+        ])
+
         results = await retrieve_chunks_from_tower(
             document_id="doc1",
             query="revenue",
@@ -6,20 +6,31 @@ from youtube_transcript_api import (
     VideoUnavailable
 )
 from requests.exceptions import ConnectionError, Timeout, HTTPError
-from pytube import YouTube, exceptions
-import subprocess
 import os
+import re
 import sys
 import runpod
 from datetime import datetime
 import asyncio
-import json
+import contextlib
+import functools
+import orjson
 import tempfile
+import time
 import shutil
 import base64
-import requests
 from dotenv import load_dotenv
 
+# Optional in-process resampling: skips the FFmpeg fork for formats
+# libsndfile can decode. Falls back to FFmpeg when unavailable.
+try:
+    import numpy as np
+    import soundfile as sf
+    from scipy.signal import resample_poly
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
 # Load environment variables from root .env file
 # Get the root directory (2 levels up from tests/services/)
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,24 +42,17 @@ sys.path.append(root_dir)
 from backend.core.logging import log_handler
 
 # ================= Configuration =================
-IMAGEKIT_UPLOAD_URL = "https://upload.imagekit.io/api/v1/files/upload"
-IMAGEKIT_DELETE_URL = "https://api.imagekit.io/v1/files"
-
 # Test configuration flags
 SKIP_TRANSCRIPT_CHECK = True  # Set to True to test only audio transcription flow
 
 # Environment variables
 RUNPOD_API_KEY = os.getenv("RUNPOD_API_KEY")
 RUNPOD_ENDPOINT_ID = os.getenv("RUNPOD_ENDPOINT_ID")
-IMAGEKIT_PRIVATE_KEY = os.getenv("IMAGEKIT_PRIVATE_KEY")
-IMAGEKIT_URL_ENDPOINT = os.getenv("IMAGEKIT_URL_ENDPOINT")
 
 # Validate required environment variables
 required_vars = {
     "RUNPOD_API_KEY": RUNPOD_API_KEY,
-    "RUNPOD_ENDPOINT_ID": RUNPOD_ENDPOINT_ID,
-    "IMAGEKIT_PRIVATE_KEY": IMAGEKIT_PRIVATE_KEY,
-    "IMAGEKIT_URL_ENDPOINT": IMAGEKIT_URL_ENDPOINT
+    "RUNPOD_ENDPOINT_ID": RUNPOD_ENDPOINT_ID
 }
 
 missing_vars = [var for var, value in required_vars.items() if not value]
@@ -58,69 +62,52 @@ if missing_vars:
     log_handler.info(f"Looking for .env file at: {env_path}")
     sys.exit(1)
 
-# ================= Helper Function for image kit =================
-def upload_wav_to_imagekit(local_wav_path: str) -> tuple[str, str]:
-    if not os.path.exists(local_wav_path):
-        error_msg = f"File not found: {local_wav_path}"
-        log_handler.error(error_msg)
-        raise FileNotFoundError(error_msg)
-
-    log_handler.info(f"Uploading WAV file to ImageKit: {local_wav_path}")
-
-    auth = base64.b64encode(
-        f"{IMAGEKIT_PRIVATE_KEY}:".encode()
-    ).decode()
-
-    with open(local_wav_path, "rb") as f:
-        response = requests.post(
-            IMAGEKIT_UPLOAD_URL,
-            headers={
-                "Authorization": f"Basic {auth}"
-            },
-            files={
-                "file": f
-            },
-            data={
-                "fileName": os.path.basename(local_wav_path),
-                "useUniqueFileName": "true"
-            }
-        )
-
-    if response.status_code != 200:
-        error_msg = f"ImageKit upload failed: {response.text}"
-        log_handler.error(error_msg)
-        raise RuntimeError(error_msg)
-
-    data = response.json()
-    log_handler.info(f"Successfully uploaded to ImageKit: {data['url']}")
-    return data["url"], data["fileId"]
-
-def delete_from_imagekit(file_id: str):
-    log_handler.info(f"Deleting file from ImageKit: {file_id}")
-    
-    auth = base64.b64encode(
-        f"{IMAGEKIT_PRIVATE_KEY}:".encode()
-    ).decode()
-
-    response = requests.delete(
-        f"{IMAGEKIT_DELETE_URL}/{file_id}",
-        headers={
-            "Authorization": f"Basic {auth}"
-        }
-    )
-
-    if response.status_code not in (200, 204):
-        error_msg = f"ImageKit delete failed: {response.text}"
-        log_handler.error(error_msg)
-        raise RuntimeError(error_msg)
-    
-    log_handler.info(f"Successfully deleted file from ImageKit: {file_id}")
+# ================= Transcript cache =================
+# Transcripts are immutable per video ID, so re-runs can skip the
+# YouTube round-trip entirely: an lru_cache covers repeats within one
+# run, a disk cache covers repeats across runs. Entries older than 30
+# days are refetched as a safety valve.
+_TRANSCRIPT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "yt_transcript_cache")
+_TRANSCRIPT_CACHE_MAX_AGE = 30 * 24 * 3600
+
+def _cache_transcript(func):
+    @functools.lru_cache(maxsize=64)
+    def wrapper(video_id: str) -> str:
+        cache_file = os.path.join(_TRANSCRIPT_CACHE_DIR, f"{video_id}.txt")
+        try:
+            stat = os.stat(cache_file)
+            if stat.st_size and (time.time() - stat.st_mtime) < _TRANSCRIPT_CACHE_MAX_AGE:
+                with open(cache_file, encoding="utf-8") as f:
+                    text = f.read()
+                if text:
+                    log_handler.info(f"Transcript cache hit for video {video_id}")
+                    return text
+        except OSError:
+            pass
+
+        text = func(video_id)
+        try:
+            os.makedirs(_TRANSCRIPT_CACHE_DIR, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(text)
+            # Atomic publish so a crashed run never leaves a torn entry
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            log_handler.warning(f"Failed to cache transcript for {video_id}: {e}")
+        return text
+
+    return functools.wraps(func)(wrapper)
 
 # ================= Helper Functions =================
+# One precompiled pattern covers both watch?v= and youtu.be/ forms and
+# validates the 11-char ID charset in the same pass
+_YT_ID_RE = re.compile(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+
 def get_y_video_id(vid_url: str) -> str:
     """
     Extract the video ID from a YouTube URL.
-    
+
     Raises:
         TypeError: If the input is not a string.
         ValueError: If the URL is not a valid YouTube link.
@@ -131,33 +118,24 @@ def get_y_video_id(vid_url: str) -> str:
         log_handler.error(error_msg)
         raise TypeError(error_msg)
 
-    #Extract video ID
-    try:
-        if "v=" in vid_url:
-            video_id = vid_url.split("v=")[-1].split("&")[0]
-        elif "youtu.be/" in vid_url:
-            video_id = vid_url.split("/")[-1]
-        else:
-            error_msg = "URL does not appear to be a valid YouTube link."
-            log_handler.error(f"Invalid YouTube URL: {vid_url}")
-            raise ValueError(error_msg)
-        
-        log_handler.debug(f"Extracted video ID: {video_id} from URL: {vid_url}")
-        return video_id
-        
-    except ValueError as e:
-        error_msg = f"ERROR, invalid YouTube URL: {e}"
-        log_handler.error(error_msg)
-        raise ValueError(error_msg)
-    except Exception as e:
-        error_msg = f"Unexpected error getting youtube video ID: {e}"
-        log_handler.error(error_msg)
-        raise RuntimeError(error_msg)
+    #Extract video ID in a single scan
+    match = _YT_ID_RE.search(vid_url)
+    if not match:
+        log_handler.error(f"Invalid YouTube URL: {vid_url}")
+        raise ValueError("ERROR, invalid YouTube URL: URL does not appear to be a valid YouTube link.")
+
+    video_id = match.group(1)
+    log_handler.debug(f"Extracted video ID: {video_id} from URL: {vid_url}")
+    return video_id
 
+@_cache_transcript
 def extract_full_transcript(video_id: str) -> str:
     """
     Retrieve the full transcript from YouTube captions, if available.
 
+    Results are cached on disk keyed by video ID (see _cache_transcript),
+    so repeat runs for the same video never hit YouTube.
+
     Raises:
         TypeError: If the input is not a string.
         TranscriptsDisabled: If captions are disabled.
@@ -180,9 +158,10 @@ def extract_full_transcript(video_id: str) -> str:
         #Fetch transcript for English
         fetched = ytt_api.fetch(video_id)
 
-        #Convert to plain text
-        full_text = " ".join([segment["text"] for segment in fetched.to_raw_data()])
-        
+        #Convert to plain text straight off the snippet iterator — no
+        #intermediate list of dicts from to_raw_data()
+        full_text = " ".join(snippet.text for snippet in fetched)
+
         log_handler.info(f"Successfully extracted transcript from YouTube captions for video {video_id}")
         log_handler.debug(f"Transcript length: {len(full_text)} characters")
         return full_text
@@ -204,6 +183,18 @@ def extract_full_transcript(video_id: str) -> str:
         log_handler.error(error_msg)
         raise RuntimeError(error_msg)
 
+@functools.lru_cache(maxsize=256)
+def _probe_video_info(vid_url: str) -> tuple:
+    """
+    Resolve video metadata once per URL.
+
+    The watch-page fetch behind extract_info costs a few hundred ms, so
+    retries and reprocessing of the same URL reuse the cached result.
+    """
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        info = ydl.extract_info(vid_url, download=False)
+    return info.get("title", "Unknown"), info.get("duration", "Unknown")
+
 async def download_full_audio_ytdlp(vid_url: str, output_dir: str) -> str:
     """
     Download the full audio track from a YouTube video using yt-dlp.
@@ -235,12 +226,12 @@ async def download_full_audio_ytdlp(vid_url: str, output_dir: str) -> str:
 
     try:
         def download_sync():
+            # Get info first (cached per URL across retries)
+            title, duration = _probe_video_info(vid_url)
+            log_handler.info(f"Video title: {title}")
+            log_handler.info(f"Video duration: {duration} seconds")
+
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Get info first
-                info = ydl.extract_info(vid_url, download=False)
-                log_handler.info(f"Video title: {info.get('title', 'Unknown')}")
-                log_handler.info(f"Video duration: {info.get('duration', 'Unknown')} seconds")
-                
                 # Download
                 ydl.download([vid_url])
                 
@@ -264,17 +255,21 @@ async def download_full_audio_ytdlp(vid_url: str, output_dir: str) -> str:
         log_handler.error(error_msg)
         raise RuntimeError(error_msg)
 
-async def download_full_audio(vid_url: str) -> str:
+async def download_full_audio(vid_url: str, output_dir: str) -> str:
     """
-    Download the full audio track from a YouTube video that must be processed
-    to extract the data subsequently.
+    Stream a YouTube audio track straight through FFmpeg to 16 kHz mono
+    FLAC, without writing the intermediate container to disk.
+
+    yt-dlp writes the raw audio bytes to stdout and FFmpeg reads them
+    from stdin over an OS pipe, so the download crosses the kernel once
+    instead of being written to disk and read back for transcoding.
+    aria2c cannot write to a pipe, so this path uses yt-dlp's built-in
+    downloader.
 
     Raises:
         TypeError: If vid_url is not a string.
         ValueError: If the URL is invalid or video ID extraction fails.
-        pytube.exceptions.VideoUnavailable: If the video is private, removed, or blocked.
-        pytube.exceptions.AgeRestrictedError: If the video is age restricted.
-        RuntimeError: For any other unexpected error during download.
+        RuntimeError: For any error during download or conversion.
     """
     #Check input type of given parameter
     if not isinstance(vid_url, str):
@@ -286,36 +281,68 @@ async def download_full_audio(vid_url: str) -> str:
     filename = get_y_video_id(vid_url)
     #Get current date and time in YYYYMMDD_HHMMSS format
     current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file_path = os.path.join(output_dir, f"video_{filename}_{current_time}.flac")
 
-    log_handler.info(f"Starting audio download for video {filename} using pytube")
+    log_handler.info(f"Streaming audio for video {filename}: yt-dlp -> ffmpeg -> {output_file_path}")
 
-    #Download the audio
+    #Download and transcode in one pass
     try:
-        youtube_vid = YouTube(vid_url)
-        stream = youtube_vid.streams.filter(only_audio=True).first()
+        read_fd, write_fd = os.pipe()
+        try:
+            yt_proc = await asyncio.create_subprocess_exec(
+                "yt-dlp", "-f", "bestaudio[ext=m4a]/bestaudio",
+                "-o", "-", vid_url,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            ff_proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y", "-i", "pipe:0",
+                "-ar", "16000", "-ac", "1",
+                "-c:a", "flac", "-compression_level", "5",
+                output_file_path,
+                stdin=read_fd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        finally:
+            #Both ends now live in the children; the parent's copies
+            #must close or FFmpeg never sees EOF
+            os.close(read_fd)
+            os.close(write_fd)
+
+        try:
+            (_, yt_err), (_, ff_err) = await asyncio.gather(
+                yt_proc.communicate(), ff_proc.communicate()
+            )
+        except asyncio.CancelledError:
+            #Cancellation must not orphan the children: kill both and
+            #wait for them so nothing is still writing into the temp
+            #dir when the caller tears it down
+            for proc in (yt_proc, ff_proc):
+                if proc.returncode is None:
+                    proc.kill()
+            await asyncio.gather(yt_proc.wait(), ff_proc.wait())
+            raise
+        if yt_proc.returncode:
+            raise RuntimeError(f"yt-dlp exited with {yt_proc.returncode}: {yt_err.decode(errors='replace')}")
+        if ff_proc.returncode:
+            raise RuntimeError(f"ffmpeg exited with {ff_proc.returncode}: {ff_err.decode(errors='replace')}")
+
+        log_handler.info(f"Audio download and conversion completed: {output_file_path}")
+        return output_file_path
 
-        full_audio_name = f"video_{filename}_{current_time}.mp4"
-        audio_file = await asyncio.to_thread(stream.download, filename=full_audio_name)
-        
-        log_handler.info(f"Audio download completed: {audio_file}")
-        return audio_file
-    
-    except exceptions.VideoUnavailable as e:
-        error_msg = f"Video unavailable: {vid_url}: {e}"
-        log_handler.error(error_msg)
-        raise exceptions.VideoUnavailable(error_msg)
-    except exceptions.AgeRestrictedError as e:
-        error_msg = f"Video is age restricted: {vid_url}: {e}"
-        log_handler.error(error_msg)
-        raise exceptions.AgeRestrictedError(error_msg)
     except Exception as e:
         error_msg = f"Unexpected error downloading audio from YouTube: {e}"
         log_handler.error(error_msg)
         raise RuntimeError(error_msg)
 
-async def convert_to_wav(input_file_path: str) -> str:
+async def convert_to_upload_format(input_file_path: str) -> str:
     """
-    Convert audio to WAV format suitable for transcription.
+    Convert audio to 16 kHz mono FLAC suitable for transcription.
+
+    FLAC is lossless, Whisper accepts it directly, and it compresses
+    speech to a fraction of raw PCM, so the transcription payload moves
+    far fewer bytes than the previous WAV output.
 
     Raises:
         TypeError: If input_file_path are not strings.
@@ -334,69 +361,95 @@ async def convert_to_wav(input_file_path: str) -> str:
         log_handler.error(error_msg)
         raise FileNotFoundError(error_msg)
 
-    #Determine output path with same base name but .wav extension
+    #Determine output path with same base name but .flac extension
     base_name = os.path.splitext(os.path.basename(input_file_path))[0]
     dir_name = os.path.dirname(input_file_path)
-    output_file_path = os.path.join(dir_name, f"{base_name}.wav")
+    output_file_path = os.path.join(dir_name, f"{base_name}.flac")
 
-    log_handler.info(f"Converting audio to WAV: {input_file_path} -> {output_file_path}")
+    log_handler.info(f"Converting audio to FLAC: {input_file_path} -> {output_file_path}")
 
-    #intra_Function to run FFmpeg synchronously
-    def ffmpeg_convert():
-        subprocess.run([
-            "ffmpeg", "-y", "-i", input_file_path,
-            "-ar", "16000", "-ac", "1", output_file_path
-        ], check=True)
-        return output_file_path
+    #Fast path: decode + resample in-process, no fork/exec and no extra
+    #disk round-trip. libsndfile can't read m4a/webm, so any decode
+    #failure simply drops through to FFmpeg.
+    if SOUNDFILE_AVAILABLE:
+        def resample_in_process():
+            data, sample_rate = sf.read(input_file_path, dtype="int16")
+            mono = data.mean(axis=1).astype(np.int16) if data.ndim == 2 else data
+            if sample_rate != 16000:
+                mono = resample_poly(mono, 16000, sample_rate).astype(np.int16)
+            sf.write(output_file_path, mono, 16000, subtype="PCM_16")
+
+        try:
+            await asyncio.to_thread(resample_in_process)
+            log_handler.info(f"Audio conversion completed in-process: {output_file_path}")
+            return output_file_path
+        except Exception as e:
+            log_handler.debug(f"In-process conversion unavailable for this input ({e}); using FFmpeg")
 
-    #Convert wav using FFmpeg
+    #Convert audio using FFmpeg driven by the event loop (no worker
+    #thread parked on a blocking subprocess.run)
     try:
-        wav_file = await asyncio.to_thread(ffmpeg_convert)
-        log_handler.info(f"Audio conversion completed: {wav_file}")
-        return wav_file
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-i", input_file_path,
+            "-ar", "16000", "-ac", "1",
+            "-c:a", "flac", "-compression_level", "5",
+            output_file_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, err = await proc.communicate()
+        if proc.returncode:
+            error_msg = f"Error converting to FLAC: {err.decode(errors='replace')}"
+            log_handler.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        log_handler.info(f"Audio conversion completed: {output_file_path}")
+        return output_file_path
 
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Error converting to WAV: {e}"
-        log_handler.error(error_msg)
-        raise RuntimeError(error_msg)
     except FileNotFoundError:
         error_msg = "FFmpeg not found. Please install FFmpeg and ensure it's in your PATH."
         log_handler.error(error_msg)
         raise RuntimeError(error_msg)
+    except RuntimeError:
+        raise
     except Exception as e:
-        error_msg = f"Unexpected error converting audio to wav format: {e}"
+        error_msg = f"Unexpected error converting audio to FLAC format: {e}"
         log_handler.error(error_msg)
         raise RuntimeError(error_msg)
 
-async def transcribe_with_runpod(audio_url: str) -> dict:
+async def transcribe_with_runpod(audio_path: str) -> dict:
     """
-    Send audio file to RunPod Whisper endpoint for transcription.
+    Send audio bytes to the RunPod Whisper endpoint for transcription.
+
+    The audio is sent inline as base64 instead of a public file URL, so
+    the bytes cross the wire once — no intermediate storage upload, no
+    delete call afterwards.
 
     Raises:
-        TypeError: If audio_url is not a string.
+        TypeError: If audio_path is not a string.
         RuntimeError: If transcription fails.
     """
-    if not isinstance(audio_url, str):
-        error_msg = "audio_url must be a string."
+    if not isinstance(audio_path, str):
+        error_msg = "audio_path must be a string."
         log_handler.error(error_msg)
         raise TypeError(error_msg)
 
-    log_handler.info(f"Starting transcription with RunPod for audio URL: {audio_url}")
+    log_handler.info(f"Starting transcription with RunPod for audio file: {audio_path}")
 
     try:
         import runpod
-        
+
         # Initialize the client
         runpod.api_key = RUNPOD_API_KEY
-        
+
         log_handler.info(f"Calling RunPod with endpoint: {RUNPOD_ENDPOINT_ID}")
-        log_handler.debug(f"Audio URL: {audio_url}")
+        log_handler.debug(f"Audio path: {audio_path}")
         log_handler.debug(f"RunPod version: {runpod.__version__ if hasattr(runpod, '__version__') else 'Unknown'}")
-        
+
         # Create endpoint object
         endpoint = runpod.Endpoint(RUNPOD_ENDPOINT_ID)
         log_handler.debug(f"Endpoint object created: {endpoint}")
-        
+
         # Health check to wake up serverless endpoint
         log_handler.info("Checking endpoint health to warm up...")
         try:
@@ -404,16 +457,20 @@ async def transcribe_with_runpod(audio_url: str) -> dict:
             log_handler.debug(f"RunPod health: {health}")
         except Exception as e:
             log_handler.warning(f"Health check failed (this might be normal): {e}")
-        
-        # Use the correct input format for Faster Whisper endpoint
+
+        # Encode off-loop; the Faster Whisper endpoint accepts inline
+        # base64 audio alongside the URL form
+        audio_bytes = await asyncio.to_thread(
+            lambda: open(audio_path, "rb").read()
+        )
         runpod_input = {
             "input": {
-                "audio": audio_url,     # Required: audio file URL
+                "audio_base64": base64.b64encode(audio_bytes).decode(),
                 "model": "turbo"        # Optional: model selection (base, small, medium, large, turbo)
             }
         }
-        
-        log_handler.debug(f"Calling run_sync with correct payload: {runpod_input}")
+
+        log_handler.debug("Calling run_sync with inline base64 audio payload")
         
         # Synchronous call with timeout
         result = endpoint.run_sync(runpod_input, timeout=180)
@@ -454,53 +511,60 @@ async def main_async(youtube_url: str):
     try:
         log_handler.info(f"Temporary working directory created at {temp_dir}")
         
-        # ========== Try YouTube transcript first ==========
+        # ========== Race captions fetch against audio download ==========
+        # The audio download starts immediately; the cheap captions
+        # lookup runs alongside it, and whichever leg settles first
+        # decides the path. A caption hit cancels the download and skips
+        # the convert/upload/RunPod legs entirely.
+        log_handler.info("Downloading full audio for transcription...")
+        # yt-dlp pipes straight into FFmpeg: download and conversion are
+        # one streamed pass with no intermediate container on disk
+        audio_task = asyncio.create_task(download_full_audio(youtube_url, temp_dir))
+
         if not SKIP_TRANSCRIPT_CHECK:
-            log_handler.info("Checking for YouTube captions...")
+            log_handler.info("Checking for YouTube captions while audio downloads...")
+            transcript_task = asyncio.create_task(
+                asyncio.to_thread(extract_full_transcript, video_id)
+            )
+            await asyncio.wait(
+                {transcript_task, audio_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            # The captions call is cheap, so settle it either way.
             try:
-                transcript = extract_full_transcript(video_id)
-                if transcript:
-                    log_handler.info("Transcript successfully extracted from YouTube captions!")
-                    with open(f"{video_id}_transcript.txt", "w", encoding="utf-8") as f:
-                        f.write(transcript)
-                    log_handler.info(f"Full transcript saved as '{video_id}_transcript.txt'.")
-                    return transcript
+                transcript = await transcript_task
             except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, RuntimeError) as e:
                 log_handler.warning(f"No transcript available via YouTube captions: {e}")
                 log_handler.info("Proceeding with audio transcription flow...")
+                transcript = None
+            if transcript:
+                audio_task.cancel()
+                # Wait for the cancelled download to actually stop its
+                # subprocesses before the temp dir is removed
+                with contextlib.suppress(asyncio.CancelledError):
+                    await audio_task
+                log_handler.info("Transcript successfully extracted from YouTube captions!")
+                with open(f"{video_id}_transcript.txt", "w", encoding="utf-8") as f:
+                    f.write(transcript)
+                log_handler.info(f"Full transcript saved as '{video_id}_transcript.txt'.")
+                return transcript
         else:
             log_handler.info("Skipping transcript check - testing audio transcription flow only...")
 
-        # ========== Download audio ==========
-        log_handler.info("Downloading full audio for transcription...")
+        # ========== Download audio (already converted to FLAC) ==========
         try:
-            # Use yt-dlp instead of pytube for better reliability
-            audio_mp4 = await download_full_audio_ytdlp(youtube_url, temp_dir)
-            log_handler.info(f"Audio downloaded: {audio_mp4}")
-            
+            audio_flac = await audio_task
+            log_handler.info(f"Audio downloaded and converted: {audio_flac}")
+
         except Exception as e:
             log_handler.error(f"Error downloading audio: {e}")
             log_handler.error(f"Error type: {type(e).__name__}")
             raise
 
-        # ========== Convert to WAV & upload ==========
-        log_handler.info("Converting audio to WAV...")
-        audio_wav = await convert_to_wav(audio_mp4)
-        log_handler.info(f"Audio converted to WAV: {audio_wav}")
-
-        # ========== Upload WAV to ImageKit ==========
-        log_handler.info("Uploading WAV to ImageKit...")
-        audio_url, imagekit_file_id = upload_wav_to_imagekit(audio_wav)
-        log_handler.info(f"Uploaded to ImageKit: {audio_url}")
-
         # ========== RunPod transcription ==========
-        try:
-            log_handler.info("Sending audio URL to RunPod...")
-            runpod_result = await transcribe_with_runpod(audio_url)
-            log_handler.info("Transcription complete!")
-        finally:
-            log_handler.info("Deleting audio from ImageKit...")
-            delete_from_imagekit(imagekit_file_id)
+        # The audio goes to RunPod inline — no ImageKit upload/delete hop
+        log_handler.info("Sending audio to RunPod...")
+        runpod_result = await transcribe_with_runpod(audio_flac)
+        log_handler.info("Transcription complete!")
 
         # ========== Save results ==========
         log_handler.debug(f"RunPod result type: {type(runpod_result)}")
@@ -510,23 +574,27 @@ async def main_async(youtube_url: str):
             log_handler.warning("Warning: RunPod returned None, creating empty result")
             runpod_result = {"transcript": "", "status": "failed", "error": "RunPod returned None"}
         
-        with open(f"{video_id}_transcript.json", "w", encoding="utf-8") as f:
-            json.dump(runpod_result, f, indent=2)
-        
         # Handle transcript extraction based on result structure
         transcript_text = ""
         if isinstance(runpod_result, dict):
             # Try different possible keys for the transcript
-            transcript_text = (runpod_result.get("transcription") or 
-                             runpod_result.get("transcript") or 
-                             runpod_result.get("text") or 
-                             runpod_result.get("output") or 
+            transcript_text = (runpod_result.get("transcription") or
+                             runpod_result.get("transcript") or
+                             runpod_result.get("text") or
+                             runpod_result.get("output") or
                              str(runpod_result))
         else:
             transcript_text = str(runpod_result) if runpod_result else "No transcript available"
-        
-        with open(f"{video_id}_transcript.txt", "w", encoding="utf-8") as f:
-            f.write(transcript_text)
+
+        # Serialize with orjson (bytes, no str round-trip) and push both
+        # writes off the event loop in one thread hop
+        def write_results():
+            with open(f"{video_id}_transcript.json", "wb") as f:
+                f.write(orjson.dumps(runpod_result, option=orjson.OPT_INDENT_2))
+            with open(f"{video_id}_transcript.txt", "w", encoding="utf-8") as f:
+                f.write(transcript_text)
+
+        await asyncio.to_thread(write_results)
 
         log_handler.info(f"Full transcript saved as '{video_id}_transcript.txt' and JSON as '{video_id}_transcript.json'.")
         return runpod_result
@@ -550,7 +618,6 @@ if __name__ == "__main__":
     log_handler.info(f".env file exists: {os.path.exists(env_path)}")
     log_handler.info(f"RUNPOD_API_KEY loaded: {'Yes' if RUNPOD_API_KEY else 'No'}")
     log_handler.info(f"RUNPOD_ENDPOINT_ID loaded: {'Yes' if RUNPOD_ENDPOINT_ID else 'No'}")
-    log_handler.info(f"IMAGEKIT_PRIVATE_KEY loaded: {'Yes' if IMAGEKIT_PRIVATE_KEY else 'No'}")
     log_handler.info(f"SKIP_TRANSCRIPT_CHECK: {SKIP_TRANSCRIPT_CHECK}")
     log_handler.info("========================")
     
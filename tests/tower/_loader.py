@@ -0,0 +1,27 @@
+"""Shared, cached loader for the Tower app modules under test.
+
+Each app lives in a dashed directory (not importable as a package), so
+the tests load its main.py by path. Caching the exec'd module means a
+pytest session pays the source read, bytecode compile, and top-level
+imports once per app instead of once per test.
+"""
+
+import functools
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+_APPS_DIR = Path(__file__).resolve().parents[2] / "backend" / "tower" / "apps"
+
+
+@functools.lru_cache(maxsize=None)
+def load_app_module(name: str, app_dir: str):
+    """Load backend/tower/apps/<app_dir>/main.py once per session."""
+    module_path = _APPS_DIR / app_dir / "main.py"
+    spec = spec_from_file_location(name, module_path)
+    module = module_from_spec(spec)
+    assert spec.loader is not None
+    # Register before exec so imports inside the app reuse this object
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -1,7 +1,23 @@
-﻿import os
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from pyiceberg.catalog import load_catalog
 
 
+def _safe_list_tables(catalog, ns):
+    try:
+        return catalog.list_tables(ns), None
+    except Exception as e:
+        return [], e
+
+
+def _safe_load_table(catalog, table_id):
+    try:
+        return catalog.load_table(table_id)
+    except Exception as e:
+        return e
+
+
 def list_catalog_contents(catalog_name: str = "default"):
     print(f"Connecting to catalog: {catalog_name}")
     print("=" * 60)
@@ -33,42 +49,55 @@ def list_catalog_contents(catalog_name: str = "default"):
         total_tables = 0
         show_details = os.environ.get("SHOW_DETAILS", "false").lower() == "true"
 
-        for ns in namespaces:
+        # Each list_tables/load_table call is a catalog round-trip, so
+        # fan them out across threads (the client is sync but
+        # thread-safe) and print from the prefetched results in order.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            table_lists = list(
+                pool.map(lambda ns: _safe_list_tables(catalog, ns), namespaces)
+            )
+            loaded_tables = []
+            if show_details:
+                all_ids = [tid for tables, _ in table_lists for tid in tables]
+                loaded_tables = list(
+                    pool.map(lambda tid: _safe_load_table(catalog, tid), all_ids)
+                )
+        loaded_iter = iter(loaded_tables)
+
+        for ns, (tables, error) in zip(namespaces, table_lists):
             namespace_name = ".".join(ns) if isinstance(ns, tuple) else str(ns)
 
-            try:
-                tables = catalog.list_tables(ns)
+            if error is not None:
+                print(f"\n  [{namespace_name}]")
+                print(f"    (error listing tables: {error})")
+                continue
 
-                if tables:
-                    print(f"\n  [{namespace_name}]")
-                    for table_id in tables:
-                        if hasattr(table_id, "name"):
-                            table_name = table_id.name
-                        elif isinstance(table_id, tuple):
-                            table_name = str(table_id[-1])
+            if tables:
+                print(f"\n  [{namespace_name}]")
+                for table_id in tables:
+                    if hasattr(table_id, "name"):
+                        table_name = table_id.name
+                    elif isinstance(table_id, tuple):
+                        table_name = str(table_id[-1])
+                    else:
+                        table_name = str(table_id)
+                    print(f"    └─ {table_name}")
+                    total_tables += 1
+
+                    if show_details:
+                        table = next(loaded_iter)
+                        if isinstance(table, Exception):
+                            print(f"       (could not load schema: {table})")
                         else:
-                            table_name = str(table_id)
-                        print(f"    └─ {table_name}")
-                        total_tables += 1
-
-                        if show_details:
-                            try:
-                                table = catalog.load_table(table_id)
-                                schema = table.schema()
-                                print(f"       Schema: {len(schema.fields)} columns")
-                                for field in schema.fields[:5]:
-                                    print(f"         - {field.name}: {field.field_type}")
-                                if len(schema.fields) > 5:
-                                    print(f"         ... and {len(schema.fields) - 5} more columns")
-                            except Exception as e:
-                                print(f"       (could not load schema: {e})")
-                else:
-                    print(f"\n  [{namespace_name}]")
-                    print("    (no tables)")
-
-            except Exception as e:
+                            schema = table.schema()
+                            print(f"       Schema: {len(schema.fields)} columns")
+                            for field in schema.fields[:5]:
+                                print(f"         - {field.name}: {field.field_type}")
+                            if len(schema.fields) > 5:
+                                print(f"         ... and {len(schema.fields) - 5} more columns")
+            else:
                 print(f"\n  [{namespace_name}]")
-                print(f"    (error listing tables: {e})")
+                print("    (no tables)")
 
         print("\n" + "=" * 60)
         print(" SUMMARY")
@@ -1,27 +1,16 @@
 import base64
-from importlib.util import module_from_spec, spec_from_file_location
-from pathlib import Path
+import collections
+
+from tests.tower._loader import load_app_module
 
 
 def _load_module():
-    module_path = (
-        Path(__file__).resolve().parents[2]
-        / "backend"
-        / "tower"
-        / "apps"
-        / "document-ingestion"
-        / "main.py"
-    )
-    spec = spec_from_file_location("document_ingestion", module_path)
-    module = module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+    return load_app_module("document_ingestion", "document-ingestion")
 
 
 class FakeWriter:
     def __init__(self) -> None:
-        self.records = []
+        self.records = collections.deque()
 
     def upsert_document(self, record):
         self.records.append(record)
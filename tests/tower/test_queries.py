@@ -46,3 +46,38 @@ def test_tower_service_inserts_chunks():
 
     assert client.calls
     assert "INSERT INTO chunks" in client.calls[0][0]
+
+
+def test_tower_service_batches_chunk_inserts():
+    client = FakeClient()
+    service = TowerService(client=client)
+    records = [
+        {
+            "chunk_id": f"chunk-{i}",
+            "document_id": "doc-1",
+            "page_number": i,
+            "content": f"content {i}",
+            "embedding": None,
+            "created_at": "2026-01-24T00:00:00Z",
+        }
+        for i in range(3)
+    ]
+
+    result = service.insert_chunks(records)
+
+    # All records go in one multi-row statement, not one call per row
+    assert len(client.calls) == 1
+    sql, params = client.calls[0]
+    assert sql.count("(:chunk_id_") == 3
+    assert params["chunk_id_0"] == "chunk-0"
+    assert params["chunk_id_2"] == "chunk-2"
+    assert params["content_1"] == "content 1"
+    assert result == {"ok": True}
+
+
+def test_tower_service_inserts_no_chunks():
+    client = FakeClient()
+    service = TowerService(client=client)
+
+    assert service.insert_chunks([]) == []
+    assert client.calls == []
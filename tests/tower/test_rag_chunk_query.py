@@ -1,26 +1,15 @@
-from importlib.util import module_from_spec, spec_from_file_location
-from pathlib import Path
+import collections
+
+from tests.tower._loader import load_app_module
 
 
 def _load_module():
-    module_path = (
-        Path(__file__).resolve().parents[2]
-        / "backend"
-        / "tower"
-        / "apps"
-        / "rag-chunk-query"
-        / "main.py"
-    )
-    spec = spec_from_file_location("rag_chunk_query", module_path)
-    module = module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+    return load_app_module("rag_chunk_query", "rag-chunk-query")
 
 
 class FakeStore:
     def __init__(self, existing=None):
-        self.records = []
+        self.records = collections.deque()
         self._existing = existing or []
 
     def upsert(self, records):
@@ -0,0 +1,23 @@
+import pytest
+
+from backend.utils.ids import chunk_id
+
+
+class TestChunkId:
+    """Test cases for content id generation."""
+
+    def test_chunk_id_width(self):
+        """Ids are always 16 hex characters wide."""
+        for content in ("", "short", "x" * 100_000):
+            cid = chunk_id(content)
+            assert len(cid) == 16
+            assert all(c in "0123456789abcdef" for c in cid)
+
+    def test_chunk_id_stable_and_distinct(self):
+        """Same content gives the same id; different content differs."""
+        assert chunk_id("revenue grew 25%") == chunk_id("revenue grew 25%")
+        assert chunk_id("revenue grew 25%") != chunk_id("revenue grew 26%")
+
+    def test_chunk_id_accepts_bytes(self):
+        """Str and utf-8 bytes of the same content produce the same id."""
+        assert chunk_id("q3 report") == chunk_id(b"q3 report")